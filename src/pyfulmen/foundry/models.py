@@ -11,7 +11,7 @@ Design Principles:
 - Consistent RFC3339Nano timestamps and UUIDv7 correlation IDs
 """
 
-from datetime import UTC, datetime
+import time
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict
@@ -338,6 +338,10 @@ class FulmenCatalogModel(FulmenBaseModel):
     )
 
 
+# (epoch seconds, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp
+_timestamp_prefix_cache: tuple[int, str] = (-1, "")
+
+
 def utc_now_rfc3339nano() -> str:
     """Generate RFC3339Nano timestamp with microsecond precision.
 
@@ -353,11 +357,19 @@ def utc_now_rfc3339nano() -> str:
         '2025-10-13T14:32:15.123456Z'
 
     Note:
-        Uses microsecond precision (not nanosecond) as Python datetime
-        provides microsecond resolution. This is sufficient for log
-        correlation and meets enterprise requirements.
+        Uses microsecond precision (not nanosecond), matching Python datetime
+        resolution. This is sufficient for log correlation and meets
+        enterprise requirements. The formatted seconds prefix is cached, so
+        calls within the same second only format the fractional part.
     """
-    return datetime.now(UTC).isoformat(timespec="microseconds").replace("+00:00", "Z")
+    global _timestamp_prefix_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached = _timestamp_prefix_cache
+    if cached[0] != seconds:
+        # Single tuple assignment keeps (seconds, prefix) consistent across threads
+        cached = (seconds, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)))
+        _timestamp_prefix_cache = cached
+    return f"{cached[1]}.{nanos // 1000:06d}Z"
 
 
 def generate_correlation_id() -> str:
@@ -28,6 +28,7 @@ from ._hash import hash_bytes, hash_string
 from ._helpers import (
     compare_digests,
     format_checksum,
+    hash_many,
     multi_hash,
     multi_hash_bytes,
     multi_hash_file,
@@ -64,6 +65,7 @@ __all__ = [
     "hash_string",
     "hash_file",
     "hash_reader",
+    "hash_many",
     "stream",
     "StreamHasher",
     "format_checksum",
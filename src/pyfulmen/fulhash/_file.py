@@ -44,15 +44,20 @@ def _validate_chunk_size(chunk_size: int) -> None:
         raise ValueError(f"chunk_size must be <= {sys.maxsize}, got {chunk_size}")
 
 
-def _emit_operation_telemetry(algorithm: Algorithm, bytes_hashed: int, start_time: float) -> None:
+def _emit_operation_telemetry(
+    algorithm: Algorithm,
+    bytes_hashed: int,
+    start_time: float,
+    operations: int = 1,
+) -> None:
     """Emit taxonomy-registered metrics on the global registry.
 
-    Emits fulhash_operations_total_<algo> (xxh3-128/sha256 only),
-    fulhash_bytes_hashed_total, and fulhash_operation_ms.
+    Emits fulhash_operations_total_<algo> (xxh3-128/sha256 only, incremented
+    by operations), fulhash_bytes_hashed_total, and fulhash_operation_ms.
     """
     operation_counter = _OPERATION_COUNTERS.get(algorithm)
     if operation_counter is not None:
-        counter(operation_counter).inc()
+        counter(operation_counter).inc(operations)
     counter("fulhash_bytes_hashed_total").inc(bytes_hashed)
     duration_ms = (time.perf_counter() - start_time) * 1000
     histogram("fulhash_operation_ms").observe(duration_ms)
@@ -7,11 +7,19 @@ checksum strings according to the checksum-string.schema.json specification.
 import hmac
 import io
 import re
+import time
 import warnings
+from collections.abc import Iterable
 from pathlib import Path
 from typing import BinaryIO
 
-from ._file import DEFAULT_CHUNK_SIZE, _validate_chunk_size, hash_file, hash_reader
+from ._file import (
+    DEFAULT_CHUNK_SIZE,
+    _emit_operation_telemetry,
+    _validate_chunk_size,
+    hash_file,
+    hash_reader,
+)
 from ._hash import hash_bytes, hash_string
 from ._stream import stream
 from .errors import (
@@ -24,6 +32,10 @@ from .models import Algorithm, Digest
 # Checksum string pattern from checksum-string.schema.json
 CHECKSUM_PATTERN = re.compile(r"^(xxh3-128:[0-9a-f]{32}|sha256:[0-9a-f]{64}|crc32:[0-9a-f]{8}|crc32c:[0-9a-f]{8})$")
 
+# Lowercase hex digest body; used with fullmatch() so a trailing newline is
+# rejected (a "$" anchor would accept one)
+_HEX_PATTERN = re.compile(r"[0-9a-f]+")
+
 # Algorithm to expected hex length mapping
 ALGORITHM_HEX_LENGTHS = {
     "xxh3-128": 32,
@@ -69,7 +81,7 @@ def format_checksum(algorithm: str | Algorithm, hex_digest: str) -> str:
 
     # Validate hex format
     expected_length = ALGORITHM_HEX_LENGTHS[algo_str]
-    if not re.match(r"^[0-9a-f]+$", hex_digest):
+    if not _HEX_PATTERN.fullmatch(hex_digest):
         raise InvalidChecksumError(f"Invalid hex format: must be lowercase hexadecimal, got: {hex_digest!r}")
 
     if len(hex_digest) != expected_length:
@@ -123,7 +135,7 @@ def parse_checksum(checksum: str) -> tuple[str, str]:
 
     # Validate hex format
     expected_length = ALGORITHM_HEX_LENGTHS[algorithm]
-    if not re.match(r"^[0-9a-f]+$", hex_digest):
+    if not _HEX_PATTERN.fullmatch(hex_digest):
         raise InvalidChecksumFormatError(f"Invalid hex format: must be lowercase hexadecimal, got: {hex_digest!r}")
 
     if len(hex_digest) != expected_length:
@@ -393,6 +405,50 @@ def verify(source: str | Path | bytes, expected_digest: str) -> bool:
         raise TypeError(f"Unsupported source type: {type(source)}")
 
 
+def hash_many(inputs: Iterable[bytes], algorithm: Algorithm = Algorithm.XXH3_128) -> list[Digest]:
+    """Compute digests for many byte inputs in one call.
+
+    Each input is hashed independently and yields the same Digest as
+    hash_bytes. Telemetry is recorded once for the whole batch rather than
+    per input: for small payloads the per-call metric emission costs far
+    more than the hash itself, so batching is much cheaper when hashing
+    many values.
+
+    Args:
+        inputs: Byte inputs to hash
+        algorithm: Hash algorithm to use (default: XXH3_128)
+
+    Returns:
+        List of Digests, in input order
+
+    Raises:
+        UnsupportedAlgorithmError: If algorithm is unsupported (ValueError subclass)
+
+    Telemetry:
+        - fulhash_operations_total_<algo> incremented by the number of inputs
+        - fulhash_bytes_hashed_total incremented by the total input size
+        - One fulhash_operation_ms observation covering the whole batch
+        - Nothing is emitted for an empty batch
+
+    Examples:
+        >>> from pyfulmen.fulhash import hash_bytes, hash_many
+        >>> digests = hash_many([b"Hello", b"World"])
+        >>> digests[0] == hash_bytes(b"Hello")
+        True
+    """
+    start_time = time.perf_counter()
+    hasher = stream(algorithm)
+    digests = []
+    bytes_hashed = 0
+    for data in inputs:
+        digests.append(hasher.reset().update(data).digest())
+        bytes_hashed += len(data)
+
+    if digests:
+        _emit_operation_telemetry(algorithm, bytes_hashed, start_time, operations=len(digests))
+    return digests
+
+
 def multi_hash_bytes(data: bytes, algorithms: list[Algorithm]) -> dict[Algorithm, Digest]:
     """Compute multiple digests of byte data in a single pass.
 
@@ -561,6 +617,7 @@ __all__ = [
     "parse_digest",
     "validate_checksum_string",
     "compare_digests",
+    "hash_many",
     "verify",
     "verify_bytes",
     "verify_text",
@@ -120,12 +120,13 @@ class StreamHasher:
             >>> final = hasher.digest()
             >>> # intermediate != final (different data)
         """
+        # Finalize once; the backends finalize on a copy of their state,
+        # so hexdigest() would repeat that work for the same result.
         digest_bytes = self._hasher.digest()
-        hex_digest = self._hasher.hexdigest()
 
         return Digest(
             algorithm=self._algorithm,
-            hex=hex_digest,
+            hex=digest_bytes.hex(),
             bytes=digest_bytes,
         )
 
@@ -6,7 +6,8 @@ Implements the Digest type and Algorithm enum according to:
 - docs/crucible-py/standards/library/modules/fulhash.md
 """
 
-from typing import Annotated, Any
+from functools import cached_property
+from typing import Annotated, Any, Self
 
 from pydantic import (
     BaseModel,
@@ -190,7 +191,7 @@ class Digest(BaseModel):
         return data
 
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def formatted(self) -> str:
         """Canonical checksum string representation.
 
@@ -198,9 +199,23 @@ class Digest(BaseModel):
 
         Conforms to checksum-string.schema.json pattern:
         ^(xxh3-128:[0-9a-f]{32}|sha256:[0-9a-f]{64}|crc32:[0-9a-f]{8}|crc32c:[0-9a-f]{8})$
+
+        Computed on first access and cached; the model is frozen, so
+        algorithm and hex cannot change underneath it.
         """
         return f"{self.algorithm.value}:{self.hex}"
 
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the digest, dropping the cached ``formatted`` when fields change.
+
+        ``model_copy`` carries the instance ``__dict__`` over, which would
+        otherwise keep a ``formatted`` value computed from the old fields.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop("formatted", None)
+        return copied
+
     def to_crucible(self) -> _crucible_fulhash.Digest:
         """Convert to the generated crucible Digest TypedDict.
 
@@ -1,7 +1,9 @@
 """TAR and TAR.GZ format handler using Python stdlib tarfile."""
 
 import logging
+import os
 import tarfile
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, cast
@@ -55,8 +57,14 @@ class TarHandler:
             return f"{operation}:gz"
         return f"{operation}:"
 
-    def create(self, source: list[str], output: str, options: CreateOptions) -> ArchiveInfo:
-        """Create archive from source files."""
+    def create(
+        self,
+        source: Sequence[str | os.PathLike[str]],
+        output: str | os.PathLike[str],
+        options: CreateOptions,
+    ) -> ArchiveInfo:
+        """Create archive from source files (str or os.PathLike paths)."""
+        output = os.fspath(output)
         mode = self._get_mode("w")
 
         entry_count = 0
@@ -1,7 +1,9 @@
 """ZIP format handler using Python stdlib zipfile."""
 
 import logging
+import os
 import zipfile
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, cast
@@ -46,8 +48,14 @@ class ZipHandler:
             )
         self.format = format
 
-    def create(self, source: list[str], output: str, options: CreateOptions) -> ArchiveInfo:
-        """Create archive from source files."""
+    def create(
+        self,
+        source: Sequence[str | os.PathLike[str]],
+        output: str | os.PathLike[str],
+        options: CreateOptions,
+    ) -> ArchiveInfo:
+        """Create archive from source files (str or os.PathLike paths)."""
+        output = os.fspath(output)
         entry_count = 0
         total_size = 0
 
@@ -307,15 +307,9 @@ def compute_checksum(file_path: str, algorithm: str = "sha256") -> str:
             f"Unsupported hash algorithm '{algorithm}'. Supported: {sorted(supported)} + fulhash algorithms"
         )
 
-    # Create hasher
-    hasher = hashlib.new(algorithm.lower())
-
-    # Stream file in chunks
+    # Stream file through hashlib's C-level reader
     with open(file_path, "rb") as f:
-        while chunk := f.read(8192):
-            hasher.update(chunk)
-
-    return hasher.hexdigest()
+        return hashlib.file_digest(f, algorithm.lower()).hexdigest()
 
 
 def verify_checksum(file_path: str, expected: str, algorithm: str = "sha256") -> bool:
@@ -32,11 +32,13 @@ from .context import (
     extract_correlation_id_from_headers,
     get_context,
     get_correlation_id,
+    run_with_current_context,
     set_context_value,
     set_correlation_id,
 )
 from .formatter import ConsoleFormatter, Formatter, JSONFormatter, TextFormatter
 from .logger import (
+    LazyValue,
     Logger,
     ProgressiveLogger,
 )
@@ -55,6 +57,7 @@ from .throttling import ThrottleController, ThrottlingMiddleware
 __all__ = [
     "Logger",
     "ProgressiveLogger",
+    "LazyValue",
     "LoggingProfile",
     "LoggingConfig",
     "LoggingPolicy",
@@ -83,6 +86,7 @@ __all__ = [
     "get_context",
     "set_context_value",
     "clear_context",
+    "run_with_current_context",
     "extract_correlation_id_from_headers",
     "emit_metrics_to_log",
 ]
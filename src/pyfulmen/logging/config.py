@@ -13,13 +13,13 @@ Example:
     >>> validate_logger_config(config)
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from typing import Any
 
 from .profiles import LoggingProfile, validate_profile_requirements
 
 
-@dataclass
+@dataclass(slots=True)
 class SinkConfig:
     """Configuration for a log sink.
 
@@ -34,7 +34,7 @@ class SinkConfig:
     options: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MiddlewareConfig:
     """Configuration for logging middleware.
 
@@ -47,7 +47,7 @@ class MiddlewareConfig:
     config: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ThrottlingConfig:
     """Configuration for log throttling and backpressure.
 
@@ -61,7 +61,7 @@ class ThrottlingConfig:
     dropPolicy: str = "drop-oldest"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggerConfig:
     """Main logger configuration with progressive profiles.
 
@@ -83,6 +83,13 @@ class LoggerConfig:
     customConfig: dict[str, Any] | None = None
 
 
+def _shallow_dict(item: Any) -> Any:
+    """Return a dataclass config's fields as a dict without deep-copying values."""
+    if is_dataclass(item):
+        return {f.name: getattr(item, f.name) for f in fields(item)}
+    return item
+
+
 def validate_logger_config(config: LoggerConfig) -> list[str]:
     """Validate LoggerConfig against profile requirements and schema.
 
@@ -105,8 +112,8 @@ def validate_logger_config(config: LoggerConfig) -> list[str]:
         errors.append(f"Invalid profile: {config.profile}")
 
     # Profile-specific validation
-    sinks_list = [sink.__dict__ if hasattr(sink, "__dict__") else sink for sink in (config.sinks or [])]
-    middleware_list = [mw.__dict__ if hasattr(mw, "__dict__") else mw for mw in (config.middleware or [])]
+    sinks_list = [_shallow_dict(sink) for sink in (config.sinks or [])]
+    middleware_list = [_shallow_dict(mw) for mw in (config.middleware or [])]
 
     profile_errors = validate_profile_requirements(
         profile=config.profile,
@@ -1,8 +1,9 @@
 """Correlation context management for distributed tracing.
 
-Provides thread-local storage for correlation IDs and context propagation utilities.
-This allows correlation IDs to flow automatically through logging calls without
-explicit passing.
+Provides context-local storage (``contextvars``) for correlation IDs and context
+propagation utilities. This allows correlation IDs to flow automatically through
+logging calls without explicit passing. Each thread starts with an empty context,
+and asyncio tasks inherit a snapshot of the context they were created in.
 
 Example:
     >>> from pyfulmen.logging import Logger, set_correlation_id
@@ -22,19 +23,28 @@ Example:
     ...         logger.info("Nested operation")  # Still uses request-123
 """
 
-import threading
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar, Token, copy_context
+from types import MappingProxyType
 from typing import Any
 
 from ..foundry import generate_correlation_id
 
-# Thread-local storage for correlation context
-_context_storage = threading.local()
+# Context-local storage for correlation context. The context dict is never
+# mutated in place: set_context_value replaces it (copy-on-write) and
+# get_context only exposes a read-only view, so asyncio tasks or copy_context()
+# snapshots that share a dict never observe each other's writes.
+_correlation_id_var: ContextVar[str | None] = ContextVar("pyfulmen_correlation_id", default=None)
+_context_var: ContextVar[dict[str, Any] | None] = ContextVar("pyfulmen_logging_context", default=None)
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+# Default correlation header names in priority order, pre-lowercased for
+# extract_correlation_id_from_headers (matching is case-insensitive)
+_DEFAULT_HEADER_NAMES_LOWER = ("x-correlation-id", "x-request-id", "request-id")
 
 
 def get_correlation_id() -> str | None:
-    """Get the current thread's correlation ID.
+    """Get the current context's correlation ID.
 
     Returns:
         Current correlation ID or None if not set
@@ -45,11 +55,11 @@ def get_correlation_id() -> str | None:
         >>> get_correlation_id()
         'abc-123'
     """
-    return getattr(_context_storage, "correlation_id", None)
+    return _correlation_id_var.get()
 
 
 def set_correlation_id(correlation_id: str | None) -> None:
-    """Set the current thread's correlation ID.
+    """Set the current context's correlation ID.
 
     Args:
         correlation_id: Correlation ID to set, or None to clear
@@ -57,34 +67,33 @@ def set_correlation_id(correlation_id: str | None) -> None:
     Example:
         >>> from pyfulmen.logging.context import set_correlation_id
         >>> set_correlation_id("request-456")
-        >>> # All subsequent logs in this thread will use request-456
+        >>> # All subsequent logs in this context will use request-456
     """
-    if correlation_id is None:
-        if hasattr(_context_storage, "correlation_id"):
-            delattr(_context_storage, "correlation_id")
-    else:
-        _context_storage.correlation_id = correlation_id
+    _correlation_id_var.set(correlation_id)
+
 
+def get_context() -> Mapping[str, Any]:
+    """Get the current context's logging context as a read-only mapping.
 
-def get_context() -> dict[str, Any]:
-    """Get the current thread's logging context.
+    The mapping cannot be modified; use set_context_value() or clear_context()
+    to change the context. Assigning through it raises TypeError. Call
+    ``dict(get_context())`` for a mutable copy.
 
     Returns:
-        Dictionary of context values (may be empty)
+        Read-only view of the context values (may be empty)
 
     Example:
         >>> from pyfulmen.logging.context import set_context_value, get_context
         >>> set_context_value("user_id", "user-123")
-        >>> get_context()
-        {'user_id': 'user-123'}
+        >>> get_context()["user_id"]
+        'user-123'
     """
-    if not hasattr(_context_storage, "context"):
-        _context_storage.context = {}
-    return _context_storage.context
+    ctx = _context_var.get()
+    return MappingProxyType(ctx) if ctx else _EMPTY_CONTEXT
 
 
 def set_context_value(key: str, value: Any) -> None:
-    """Set a value in the current thread's logging context.
+    """Set a value in the current context's logging context.
 
     Args:
         key: Context key
@@ -95,12 +104,11 @@ def set_context_value(key: str, value: Any) -> None:
         >>> set_context_value("user_id", "user-123")
         >>> set_context_value("tenant_id", "tenant-456")
     """
-    ctx = get_context()
-    ctx[key] = value
+    _context_var.set({**(_context_var.get() or {}), key: value})
 
 
 def clear_context() -> None:
-    """Clear the current thread's logging context.
+    """Clear the current context's logging context.
 
     Example:
         >>> from pyfulmen.logging.context import clear_context, get_context
@@ -109,15 +117,51 @@ def clear_context() -> None:
         >>> get_context()
         {}
     """
-    if hasattr(_context_storage, "context"):
-        _context_storage.context = {}
+    _context_var.set(None)
+
+
+class _CorrelationContext:
+    """Single-use context manager behind ``correlation_context()``.
+
+    Entry sets both ContextVars and keeps their tokens; exit resets them, which
+    restores the previous correlation ID and context without snapshotting them.
+    """
+
+    __slots__ = ("_correlation_id", "_context_values", "_correlation_token", "_context_token")
+
+    def __init__(self, correlation_id: str | None, context_values: dict[str, Any]) -> None:
+        self._correlation_id = correlation_id
+        self._context_values = context_values
+        self._correlation_token: Token[str | None] | None = None
+        self._context_token: Token[dict[str, Any] | None] | None = None
+
+    def __enter__(self) -> str:
+        # Set new correlation ID (generate if not provided)
+        correlation_id = self._correlation_id or generate_correlation_id()
+        self._correlation_token = _correlation_id_var.set(correlation_id)
+        # Always take a context token so set_context_value() and clear_context()
+        # calls inside the block are undone on exit. Stored dicts are replaced,
+        # never mutated, so without values the outer dict is re-set as is.
+        context = _context_var.get()
+        if self._context_values:
+            context = {**(context or {}), **self._context_values}
+        self._context_token = _context_var.set(context)
+        return correlation_id
+
+    def __exit__(self, *exc_info: object) -> None:
+        # Restore previous state in reverse order of entry
+        if self._context_token is not None:
+            _context_var.reset(self._context_token)
+            self._context_token = None
+        if self._correlation_token is not None:
+            _correlation_id_var.reset(self._correlation_token)
+            self._correlation_token = None
 
 
-@contextmanager
 def correlation_context(
     correlation_id: str | None = None,
     **context_values: Any,
-) -> Generator[str, None, None]:
+) -> _CorrelationContext:
     """Context manager for scoped correlation ID and context propagation.
 
     If correlation_id is not provided, generates a new UUIDv7. The correlation ID
@@ -128,8 +172,8 @@ def correlation_context(
         correlation_id: Explicit correlation ID (generates new if None)
         **context_values: Additional context values to set
 
-    Yields:
-        The correlation ID being used for this context
+    Returns:
+        Context manager whose ``__enter__`` returns the correlation ID being used
 
     Example:
         >>> from pyfulmen.logging import Logger
@@ -146,26 +190,35 @@ def correlation_context(
         >>> with correlation_context(correlation_id="req-123", user_id="user-456"):
         ...     logger.info("Processing")  # Uses req-123, includes user_id
     """
-    # Save previous state
-    previous_correlation_id = get_correlation_id()
-    previous_context = get_context().copy()
+    return _CorrelationContext(correlation_id, context_values)
+
 
-    # Set new correlation ID (generate if not provided)
-    new_correlation_id = correlation_id or generate_correlation_id()
-    set_correlation_id(new_correlation_id)
+def run_with_current_context[**P, R](fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+    """Run a callable in a copy of the current context.
 
-    # Set additional context values
-    for key, value in context_values.items():
-        set_context_value(key, value)
+    The callable sees the caller's correlation ID and logging context (and any
+    other ``ContextVar`` state), while changes it makes stay in the copy.
 
-    try:
-        yield new_correlation_id
-    finally:
-        # Restore previous state
-        set_correlation_id(previous_correlation_id)
-        clear_context()
-        for key, value in previous_context.items():
-            set_context_value(key, value)
+    Worker threads start with an empty context, so to hand correlation off to
+    a thread, copy the context in the parent and use its ``run`` as the target:
+    ``Thread(target=contextvars.copy_context().run, args=(fn,))``.
+
+    Args:
+        fn: Callable to run
+        *args: Positional arguments for ``fn``
+        **kwargs: Keyword arguments for ``fn``
+
+    Returns:
+        Return value of ``fn``
+
+    Example:
+        >>> from pyfulmen.logging.context import correlation_context, run_with_current_context
+        >>>
+        >>> with correlation_context(correlation_id="req-123"):
+        ...     # Logs with req-123; context it sets is discarded afterwards
+        ...     run_with_current_context(handle_callback, payload)
+    """
+    return copy_context().run(fn, *args, **kwargs)
 
 
 def extract_correlation_id_from_headers(
@@ -193,22 +246,18 @@ def extract_correlation_id_from_headers(
         >>> from flask import request
         >>> correlation_id = extract_correlation_id_from_headers(request.headers)
     """
-    if header_names is None:
-        header_names = [
-            "X-Correlation-ID",
-            "X-Correlation-Id",
-            "X-Request-ID",
-            "X-Request-Id",
-            "Request-ID",
-            "Request-Id",
-        ]
-
-    # Normalize headers to lowercase for case-insensitive matching
+    # Requests without headers (health checks, internal calls) skip all work
+    if not headers:
+        return None
+
+    names_lower = _DEFAULT_HEADER_NAMES_LOWER if header_names is None else [name.lower() for name in header_names]
+
+    # Normalize headers to lowercase once for case-insensitive matching
     headers_lower = {k.lower(): v for k, v in headers.items()}
 
-    # Check each header name (case-insensitive)
-    for name in header_names:
-        value = headers_lower.get(name.lower())
+    # Check each header name in priority order
+    for name in names_lower:
+        value = headers_lower.get(name)
         if value:
             return value
 
@@ -222,5 +271,6 @@ __all__ = [
     "set_context_value",
     "clear_context",
     "correlation_context",
+    "run_with_current_context",
     "extract_correlation_id_from_headers",
 ]
@@ -67,8 +67,41 @@ class JSONFormatter(Formatter):
             ensure_ascii: If True, escape non-ASCII characters (default: False)
             indent: If set, pretty-print with specified indent (default: None for compact)
         """
-        self.ensure_ascii = ensure_ascii
-        self.indent = indent
+        self._ensure_ascii = ensure_ascii
+        self._indent = indent
+        self._encoder = self._build_encoder()
+
+    def _build_encoder(self) -> json.JSONEncoder:
+        """Build the encoder for the current options.
+
+        json.dumps builds a new JSONEncoder on every call when given options;
+        the formatter builds one up front and again only when an option changes.
+        """
+        return json.JSONEncoder(
+            ensure_ascii=self._ensure_ascii,
+            indent=self._indent,
+            separators=None if self._indent is not None else (",", ":"),
+        )
+
+    @property
+    def ensure_ascii(self) -> bool:
+        """Whether non-ASCII characters are escaped."""
+        return self._ensure_ascii
+
+    @ensure_ascii.setter
+    def ensure_ascii(self, value: bool) -> None:
+        self._ensure_ascii = value
+        self._encoder = self._build_encoder()
+
+    @property
+    def indent(self) -> int | None:
+        """Pretty-print indent, or None for compact single-line output."""
+        return self._indent
+
+    @indent.setter
+    def indent(self, value: int | None) -> None:
+        self._indent = value
+        self._encoder = self._build_encoder()
 
     def format(self, event: dict[str, Any]) -> str:
         """Format event as single-line JSON.
@@ -83,20 +116,8 @@ class JSONFormatter(Formatter):
             Returns error message as JSON if formatting fails.
         """
         try:
-            if self.indent is not None:
-                # Pretty-printed JSON
-                return json.dumps(
-                    event,
-                    ensure_ascii=self.ensure_ascii,
-                    indent=self.indent,
-                )
-            else:
-                # Compact JSON (single line)
-                return json.dumps(
-                    event,
-                    ensure_ascii=self.ensure_ascii,
-                    separators=(",", ":"),
-                )
+            # Compact single-line JSON, or pretty-printed when indent is set
+            return self._encoder.encode(event)
         except Exception as e:
             # Fallback for formatting errors
             return json.dumps(
@@ -10,7 +10,7 @@ Uses sink/formatter/middleware abstractions for proper resource management
 and enterprise-grade features.
 
 Example:
-    >>> from pyfulmen.logging import Logger, LoggingProfile
+    >>> from pyfulmen.logging import LazyValue, Logger, LoggingProfile
     >>>
     >>> # Simple logging (default)
     >>> log = Logger(service="myapp")
@@ -27,23 +27,77 @@ Example:
     ...     policy_file="config/logging-policy.yaml"
     ... )
     >>>
+    >>> # Defer expensive values until a call passes the level check
+    >>> log.debug("Cache state", context={"entries": LazyValue(cache.describe)})
+    >>>
     >>> # Context manager support
     >>> with Logger(service="myapp") as log:
     ...     log.info("Inside context")
 """
 
 import time
+from collections.abc import Callable
 from typing import Any
 
 from ..telemetry import counter, histogram
 from ._models import LogEvent, LoggingConfig, LoggingPolicy, LoggingProfile
-from .context import get_context, get_correlation_id
+from .context import _context_var, _correlation_id_var
 from .formatter import JSONFormatter, TextFormatter
 from .middleware import Middleware, MiddlewarePipeline, MiddlewareRegistry
 from .policy import load_policy as _load_policy_impl
-from .severity import Severity, to_numeric_level
+from .severity import _SEVERITY_TO_NUMERIC, Severity, to_numeric_level
 from .sinks import ConsoleSink, Sink
 
+# Numeric thresholds for the per-level methods, so filtered calls return after
+# a single int compare and a count increment, without Severity conversion or
+# latency timing
+_TRACE_LEVEL = to_numeric_level(Severity.TRACE)
+_DEBUG_LEVEL = to_numeric_level(Severity.DEBUG)
+_INFO_LEVEL = to_numeric_level(Severity.INFO)
+_WARN_LEVEL = to_numeric_level(Severity.WARN)
+_ERROR_LEVEL = to_numeric_level(Severity.ERROR)
+_FATAL_LEVEL = to_numeric_level(Severity.FATAL)
+
+# Severity is a StrEnum, so this name-keyed map (like _SEVERITY_TO_NUMERIC)
+# also matches Severity members
+_SEVERITY_BY_NAME: dict[str, Severity] = {severity.value: severity for severity in Severity}
+
+
+class LazyValue:
+    """Log field value computed only when the log call is actually emitted.
+
+    Call arguments are evaluated before the logger can filter by level, so an
+    expensive value passed to a filtered-out ``debug()`` call is still built.
+    Wrapping the computation in ``LazyValue`` defers it until the call passes
+    the level check. Accepted as a keyword field value or as a value inside
+    ``context``.
+
+    Example:
+        >>> log.debug("Cache state", context={"entries": LazyValue(cache.describe)})
+    """
+
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        """Initialize lazy value.
+
+        Args:
+            factory: Zero-argument callable producing the value
+        """
+        self._factory = factory
+
+    def resolve(self) -> Any:
+        """Compute the value by calling the factory."""
+        return self._factory()
+
+
+def _resolve_lazy_values(values: dict[str, Any]) -> dict[str, Any]:
+    """Return values with LazyValue entries resolved (the same dict if there are none)."""
+    for value in values.values():
+        if isinstance(value, LazyValue):
+            return {k: v.resolve() if isinstance(v, LazyValue) else v for k, v in values.items()}
+    return values
+
 
 class ProgressiveLogger:
     """Progressive logger with profile-based configuration.
@@ -91,6 +145,11 @@ class ProgressiveLogger:
             self.middleware = self._create_middleware()
         self.throttle = self._create_throttle()
 
+        # Resolve the profile's serialization path once instead of on every event
+        self._emit_event: Callable[[LogEvent], None] = (
+            self._emit_text_event if config.profile == LoggingProfile.SIMPLE else self._emit_json_event
+        )
+
         # Validate policy if ENTERPRISE
         if config.profile == LoggingProfile.ENTERPRISE and self.policy:
             self._enforce_policy()
@@ -242,46 +301,54 @@ class ProgressiveLogger:
         Returns:
             True if message should be logged, False otherwise
         """
-        severity_obj = Severity(severity) if isinstance(severity, str) else severity
-        return to_numeric_level(severity_obj) >= self._min_level
+        numeric_level = _SEVERITY_TO_NUMERIC.get(severity)
+        if numeric_level is None:
+            # Unknown name: Severity() raises the ValueError callers expect
+            numeric_level = to_numeric_level(Severity(severity))
+        return numeric_level >= self._min_level
 
-    def _emit_event(self, event: LogEvent) -> None:
-        """Process and emit log event through pipeline.
+    def _emit_text_event(self, event: LogEvent) -> None:
+        """Emit log event to sinks as SIMPLE profile text fields.
 
         Args:
             event: Log event to emit
         """
-        # Serialize event based on profile
-        if self.config.profile == LoggingProfile.SIMPLE:
-            # For SIMPLE, pass event fields to TextFormatter
-            event_dict = {
-                "timestamp": event.timestamp,
-                "severity": event.severity,
-                "service": event.service,
-                "message": event.message,
-            }
-            # Include component if present
-            if event.component:
-                event_dict["component"] = event.component
-            # Include context if present for inline display
-            if event.context:
-                event_dict["context"] = event.context
-            for sink in self.sinks:
-                sink.emit(event_dict)
-        else:
-            # STRUCTURED/ENTERPRISE: JSON serialization
-            event_dict = event.to_json_dict_with_computed(exclude_none=True, exclude_defaults=False)
+        # For SIMPLE, pass event fields to TextFormatter
+        event_dict = {
+            "timestamp": event.timestamp,
+            "severity": event.severity,
+            "service": event.service,
+            "message": event.message,
+        }
+        # Include component if present
+        if event.component:
+            event_dict["component"] = event.component
+        # Include context if present for inline display
+        if event.context:
+            event_dict["context"] = event.context
+        for sink in self.sinks:
+            sink.emit(event_dict)
+
+    def _emit_json_event(self, event: LogEvent) -> None:
+        """Process and emit log event through pipeline as a JSON envelope.
+
+        Used by STRUCTURED, ENTERPRISE and CUSTOM profiles.
+
+        Args:
+            event: Log event to emit
+        """
+        event_dict = event.to_json_dict_with_computed(exclude_none=True, exclude_defaults=False)
 
-            # Process through middleware if configured
-            if self.middleware:
-                event_dict = self.middleware.process(event_dict)
-                if event_dict is None:
-                    # Dropped by middleware (e.g., throttling)
-                    return
+        # Process through middleware if configured
+        if self.middleware:
+            event_dict = self.middleware.process(event_dict)
+            if event_dict is None:
+                # Dropped by middleware (e.g., throttling)
+                return
 
-            # Emit to all sinks
-            for sink in self.sinks:
-                sink.emit(event_dict)
+        # Emit to all sinks
+        for sink in self.sinks:
+            sink.emit(event_dict)
 
     def log(
         self,
@@ -294,18 +361,29 @@ class ProgressiveLogger:
         Args:
             severity: Severity level (TRACE, DEBUG, INFO, WARN, ERROR, FATAL)
             message: Log message
-            **kwargs: Additional context fields
+            **kwargs: Additional context fields (values may be LazyValue)
 
         Telemetry:
             - Emits logging_emit_count counter (on each log call)
             - Emits logging_emit_latency_ms histogram (emission duration)
 
+            Calls filtered out by the configured level still increment
+            logging_emit_count but return without timing, so they record no
+            latency sample.
+
         Note:
             Metrics accumulate in the global telemetry registry, whose
             event buffer is unbounded. Long-running applications that log
             heavily should periodically consume the buffer via
             ``pyfulmen.telemetry.drain_events()``.
         """
+        if not self._should_log(severity):
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(severity, message, kwargs)
+
+    def _emit_timed(self, severity: Severity | str, message: str, kwargs: dict[str, Any]) -> None:
+        """Emit an already level-checked message and record logging telemetry."""
         start_time = time.perf_counter()
 
         try:
@@ -321,31 +399,36 @@ class ProgressiveLogger:
         message: str,
         **kwargs: Any,
     ) -> None:
-        """Internal implementation of log without telemetry."""
-        # Check if should log
-        if not self._should_log(severity):
-            return
-
+        """Internal implementation of log without telemetry or level check."""
         # Normalize severity
         severity_str = severity.value if isinstance(severity, Severity) else severity
 
-        # Merge thread-local context
-        merged_kwargs = kwargs.copy()
+        # Merge context-local state; **kwargs is already a fresh dict owned by this
+        # call (a new one is built only if LazyValue fields need resolving)
+        merged_kwargs = _resolve_lazy_values(kwargs)
 
         # Add correlation_id from context if not provided
         if "correlation_id" not in merged_kwargs:
-            context_correlation_id = get_correlation_id()
+            context_correlation_id = _correlation_id_var.get()
             if context_correlation_id:
                 merged_kwargs["correlation_id"] = context_correlation_id
 
-        # Merge thread-local context with explicit context
-        thread_context = get_context()
+        # Merge context-local context with explicit context. Read the ContextVar
+        # directly: get_context() wraps it in a read-only view, and the common
+        # no-context case should do nothing here.
+        thread_context = _context_var.get()
         if thread_context:
             if "context" in merged_kwargs:
                 merged_context = {**thread_context, **merged_kwargs["context"]}
                 merged_kwargs["context"] = merged_context
             else:
-                merged_kwargs["context"] = thread_context.copy()
+                # LogEvent validation copies the dict, so no defensive copy here
+                merged_kwargs["context"] = thread_context
+
+        # Resolve deferred context values without mutating the caller's dict
+        context = merged_kwargs.get("context")
+        if context:
+            merged_kwargs["context"] = _resolve_lazy_values(context)
 
         # Handle component: prefer kwargs over logger's component
         component = merged_kwargs.pop("component", None) or self.component or None
@@ -368,40 +451,63 @@ class ProgressiveLogger:
 
     def trace(self, message: str, **kwargs: Any) -> None:
         """Log TRACE level message."""
-        self.log(Severity.TRACE, message, **kwargs)
+        if self._min_level > _TRACE_LEVEL:
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(Severity.TRACE, message, kwargs)
 
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log DEBUG level message."""
-        self.log(Severity.DEBUG, message, **kwargs)
+        if self._min_level > _DEBUG_LEVEL:
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(Severity.DEBUG, message, kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
         """Log INFO level message."""
-        self.log(Severity.INFO, message, **kwargs)
+        if self._min_level > _INFO_LEVEL:
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(Severity.INFO, message, kwargs)
 
     def warn(self, message: str, **kwargs: Any) -> None:
         """Log WARN level message."""
-        self.log(Severity.WARN, message, **kwargs)
+        if self._min_level > _WARN_LEVEL:
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(Severity.WARN, message, kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
         """Log ERROR level message."""
-        self.log(Severity.ERROR, message, **kwargs)
+        if self._min_level > _ERROR_LEVEL:
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(Severity.ERROR, message, kwargs)
 
     def fatal(self, message: str, **kwargs: Any) -> None:
         """Log FATAL level message."""
-        self.log(Severity.FATAL, message, **kwargs)
+        if self._min_level > _FATAL_LEVEL:
+            counter("logging_emit_count").inc()
+            return
+        self._emit_timed(Severity.FATAL, message, kwargs)
 
     def set_level(self, level: Severity | str) -> None:
         """Dynamically change the minimum logging level.
 
         Args:
-            level: New minimum severity level
+            level: New minimum severity level (Severity or exact name, as for log())
+
+        Raises:
+            ValueError: If level is not a Severity or a known severity name
 
         Example:
             >>> logger.set_level(Severity.DEBUG)
             >>> logger.set_level("ERROR")
         """
-        level_obj = Severity(level) if isinstance(level, str) else level
-        self._min_level = to_numeric_level(level_obj)
+        level_obj = _SEVERITY_BY_NAME.get(level) if isinstance(level, str) else None
+        if level_obj is None:
+            raise ValueError(f"{level!r} is not a valid Severity")
+        self._min_level = _SEVERITY_TO_NUMERIC[level_obj]
         self.default_level = level_obj.value
 
     def flush(self) -> None:
@@ -495,6 +601,7 @@ def Logger(  # noqa: N802
 
 
 __all__ = [
+    "LazyValue",
     "Logger",
     "ProgressiveLogger",
 ]
@@ -80,8 +80,9 @@ class Severity(StrEnum):
         return self.numeric_level >= other.numeric_level
 
 
-# Severity to numeric level mapping (Crucible standard)
-_SEVERITY_TO_NUMERIC: dict[Severity, int] = {
+# Severity to numeric level mapping (Crucible standard). Severity is a StrEnum,
+# so exact names like "INFO" also hit these keys without enum construction.
+_SEVERITY_TO_NUMERIC: dict[str, int] = {
     Severity.TRACE: 0,
     Severity.DEBUG: 10,
     Severity.INFO: 20,
@@ -146,6 +147,10 @@ def to_numeric_level(severity: Severity | str) -> int:
         >>> to_numeric_level('WARN')
         30
     """
+    level = _SEVERITY_TO_NUMERIC.get(severity)
+    if level is not None:
+        return level
+
     if isinstance(severity, str):
         try:
             severity = Severity(severity)
@@ -112,11 +112,14 @@ class ConsoleSink(Sink):
             printing to stderr if formatting fails.
         """
         try:
+            # Serialize outside the lock; it only needs to guard the write
+            formatted = self.formatter.format(event)
             with self._lock:
-                formatted = self.formatter.format(event)
                 # Use sys.stderr dynamically if no custom stream provided
                 stream = self._stream if self._stream is not None else sys.stderr
-                print(formatted, file=stream, flush=True)
+                # One write per line (print() issues separate writes for text and end)
+                stream.write(formatted + "\n")
+                stream.flush()
         except Exception as e:
             # Last resort error handling - don't let logging break the app
             print(
@@ -220,9 +223,10 @@ class FileSink(Sink):
             printing to stderr if write fails.
         """
         try:
+            # Serialize outside the lock; it only needs to guard the write
+            formatted = self.formatter.format(event)
             with self._lock:
                 if self._file and not self._file.closed:
-                    formatted = self.formatter.format(event)
                     self._file.write(formatted + "\n")
                     self._file.flush()
         except Exception as e:
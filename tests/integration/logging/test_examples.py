@@ -70,6 +70,7 @@ class TestLoggingExamples:
         assert '"service":' in result.stderr or '"service": ' in result.stderr
         assert "api-service" in result.stderr
 
+    @pytest.mark.slow
     def test_logging_enterprise_example_runs(self):
         """Test examples/logging_enterprise.py runs successfully."""
         example_path = EXAMPLES_DIR / "logging_enterprise.py"
@@ -150,6 +151,7 @@ class TestExamplesNoErrors:
 
         assert result.returncode == 0, f"{example_name} has syntax errors:\n{result.stderr}"
 
+    @pytest.mark.slow
     @pytest.mark.parametrize(
         "example_name",
         [
@@ -220,6 +222,7 @@ class TestExamplesOutput:
         # Most lines should be JSON
         assert json_lines > 0, "STRUCTURED profile should produce JSON output"
 
+    @pytest.mark.slow
     def test_enterprise_example_includes_correlation_ids(self):
         """Test ENTERPRISE profile example includes correlation IDs."""
         example_path = EXAMPLES_DIR / "logging_enterprise.py"
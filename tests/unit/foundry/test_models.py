@@ -37,6 +37,15 @@ class TestUtilityFunctions:
         dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
         assert dt.tzinfo == UTC
 
+    def test_utc_now_rfc3339nano_tracks_current_time(self):
+        """RFC3339Nano timestamp should match the current UTC time across calls."""
+        before = datetime.now(UTC)
+        timestamps = [utc_now_rfc3339nano() for _ in range(3)]
+        after = datetime.now(UTC)
+
+        parsed = [datetime.fromisoformat(ts.replace("Z", "+00:00")) for ts in timestamps]
+        assert before <= parsed[0] <= parsed[1] <= parsed[2] <= after
+
     def test_generate_correlation_id_format(self):
         """Correlation ID should be valid UUID format."""
         corr_id = generate_correlation_id()
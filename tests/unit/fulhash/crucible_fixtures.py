@@ -0,0 +1,27 @@
+"""Shared loader for the Crucible FulHash fixtures.
+
+Parametrized tests need fixture data at collection time, before any pytest
+fixture runs, so modules import the loader directly. The result is cached so
+the YAML is parsed once per process no matter how many modules use it.
+"""
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Anchored to the repo root so collection works from any working directory
+REPO_ROOT = Path(__file__).resolve().parents[3]
+FIXTURES_PATH = REPO_ROOT / "config" / "crucible-py" / "library" / "fulhash" / "fixtures.yaml"
+
+
+@cache
+def load_fulhash_fixtures() -> dict[str, Any]:
+    """Load the Crucible FulHash fixtures (parsed once per process)."""
+    return yaml.load(FIXTURES_PATH.read_bytes(), Loader=_SafeLoader)
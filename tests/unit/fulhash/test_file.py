@@ -8,12 +8,19 @@ import pytest
 
 from pyfulmen.fulhash import (
     Algorithm,
+    compare_digests,
     hash,
     hash_bytes,
     hash_file,
     hash_string,
+    parse_checksum,
+    validate_checksum_string,
 )
 
+# Bind hot enum members once instead of per test call
+_XXH3 = Algorithm.XXH3_128
+_SHA = Algorithm.SHA256
+
 
 class TestHashFile:
     """Test hash_file() function."""
@@ -53,10 +60,10 @@ class TestHashFile:
         content = b"Test data"
         file_path.write_bytes(content)
 
-        digest = hash_file(file_path, Algorithm.SHA256)
+        digest = hash_file(file_path, _SHA)
 
-        expected = hash_bytes(content, Algorithm.SHA256)
-        assert digest.algorithm == Algorithm.SHA256
+        expected = hash_bytes(content, _SHA)
+        assert digest.algorithm == _SHA
         assert digest.formatted == expected.formatted
 
     def test_hash_file_empty(self, tmp_path):
@@ -178,10 +185,10 @@ class TestHashDispatcher:
     def test_hash_with_algorithm(self):
         """Test hash() with explicit algorithm."""
         data = b"test"
-        digest = hash(data, Algorithm.SHA256)
+        digest = hash(data, _SHA)
 
-        assert digest.algorithm == Algorithm.SHA256
-        expected = hash_bytes(data, Algorithm.SHA256)
+        assert digest.algorithm == _SHA
+        expected = hash_bytes(data, _SHA)
         assert digest.formatted == expected.formatted
 
     def test_hash_string_unicode(self):
@@ -278,10 +285,10 @@ class TestFileHashingChunks:
         assert digest.formatted == expected.formatted
 
     def test_file_multiple_chunks(self, tmp_path):
-        """Test file spanning multiple chunks."""
+        """Test file spanning multiple chunks with a partial tail."""
         file_path = tmp_path / "multi_chunk.bin"
-        # 3 chunks + 1KB
-        content = b"M" * (64 * 1024 * 3 + 1024)
+        # 2 chunks + 1KB tail, built from a reused 1KB pattern
+        content = (b"M" * 1024) * 129
         file_path.write_bytes(content)
 
         digest = hash_file(file_path)
@@ -307,8 +314,6 @@ class TestFileHashingIntegration:
 
     def test_hash_file_then_compare(self, tmp_path):
         """Test hashing two files and comparing."""
-        from pyfulmen.fulhash import compare_digests
-
         file1 = tmp_path / "file1.txt"
         file2 = tmp_path / "file2.txt"
         file3 = tmp_path / "file3.txt"
@@ -329,8 +334,6 @@ class TestFileHashingIntegration:
 
     def test_hash_file_format_parse(self, tmp_path):
         """Test hashing file and parsing formatted string."""
-        from pyfulmen.fulhash import parse_checksum
-
         file_path = tmp_path / "test.txt"
         file_path.write_bytes(b"Test content")
 
@@ -349,17 +352,15 @@ class TestFileHashingIntegration:
         content = b"Multi-algorithm test"
         file_path.write_bytes(content)
 
-        digest_xxh3 = hash_file(file_path, Algorithm.XXH3_128)
-        digest_sha = hash_file(file_path, Algorithm.SHA256)
+        digest_xxh3 = hash_file(file_path, _XXH3)
+        digest_sha = hash_file(file_path, _SHA)
 
         # Different algorithms should produce different results
-        assert digest_xxh3.algorithm == Algorithm.XXH3_128
-        assert digest_sha.algorithm == Algorithm.SHA256
+        assert digest_xxh3.algorithm == _XXH3
+        assert digest_sha.algorithm == _SHA
         assert digest_xxh3.formatted != digest_sha.formatted
 
         # But both should be valid
-        from pyfulmen.fulhash import validate_checksum_string
-
         assert validate_checksum_string(digest_xxh3.formatted)
         assert validate_checksum_string(digest_sha.formatted)
 
@@ -374,7 +375,7 @@ class TestTelemetry:
 
         digest = hash_file(file_path)
         assert digest is not None
-        assert digest.algorithm == Algorithm.XXH3_128
+        assert digest.algorithm == _XXH3
 
     def test_hash_file_error_with_telemetry_enabled(self):
         """Verify hash_file error path executes with telemetry."""
@@ -4,19 +4,20 @@ Validates that hash_bytes and hash_string produce digests matching
 the authoritative values in config/crucible-py/library/fulhash/fixtures.yaml
 """
 
-from pathlib import Path
-
 import pytest
-import yaml
 
 from pyfulmen.fulhash import Algorithm, hash_bytes, hash_string
 
-# Load fixtures once at module level
-FIXTURES_PATH = Path("config/crucible-py/library/fulhash/fixtures.yaml")
-with open(FIXTURES_PATH) as f:
-    FIXTURES_DATA = yaml.safe_load(f)
+from .crucible_fixtures import load_fulhash_fixtures
+
+FIXTURES_DATA = load_fulhash_fixtures()
 
 BLOCK_FIXTURES = FIXTURES_DATA["fixtures"]
+BLOCK_FIXTURES_BY_NAME = {f["name"]: f for f in BLOCK_FIXTURES}
+
+# Bind hot enum members once instead of per parametrized call
+_XXH3 = Algorithm.XXH3_128
+_SHA = Algorithm.SHA256
 
 
 class TestBlockFixtures:
@@ -34,7 +35,7 @@ class TestBlockFixtures:
             pytest.fail(f"Fixture '{fixture['name']}' missing input")
 
         # Compute hash
-        digest = hash_bytes(data, Algorithm.XXH3_128)
+        digest = hash_bytes(data, _XXH3)
 
         # Verify against fixture
         expected = fixture["xxh3_128"]
@@ -57,7 +58,7 @@ class TestBlockFixtures:
             pytest.fail(f"Fixture '{fixture['name']}' missing input")
 
         # Compute hash
-        digest = hash_bytes(data, Algorithm.SHA256)
+        digest = hash_bytes(data, _SHA)
 
         # Verify against fixture
         expected = fixture["sha256"]
@@ -79,11 +80,11 @@ class TestBlockFixtures:
         encoding = fixture["encoding"]
 
         # Test with xxh3-128
-        digest_xxh3 = hash_string(text, Algorithm.XXH3_128, encoding=encoding)
+        digest_xxh3 = hash_string(text, _XXH3, encoding=encoding)
         assert digest_xxh3.formatted == fixture["xxh3_128"]
 
         # Test with sha256
-        digest_sha256 = hash_string(text, Algorithm.SHA256, encoding=encoding)
+        digest_sha256 = hash_string(text, _SHA, encoding=encoding)
         assert digest_sha256.formatted == fixture["sha256"]
 
 
@@ -92,22 +93,20 @@ class TestFixtureEdgeCases:
 
     def test_empty_input(self):
         """Test empty input (important edge case)."""
-        digest_xxh3 = hash_bytes(b"", Algorithm.XXH3_128)
-        digest_sha256 = hash_bytes(b"", Algorithm.SHA256)
+        digest_xxh3 = hash_bytes(b"", _XXH3)
+        digest_sha256 = hash_bytes(b"", _SHA)
 
-        # Find empty-input fixture
-        empty_fixture = next(f for f in BLOCK_FIXTURES if f["name"] == "empty-input")
+        empty_fixture = BLOCK_FIXTURES_BY_NAME["empty-input"]
 
         assert digest_xxh3.formatted == empty_fixture["xxh3_128"]
         assert digest_sha256.formatted == empty_fixture["sha256"]
 
     def test_unicode_emoji(self):
         """Test Unicode emoji handling."""
-        # Find unicode-emoji fixture
-        unicode_fixture = next(f for f in BLOCK_FIXTURES if f["name"] == "unicode-emoji")
+        unicode_fixture = BLOCK_FIXTURES_BY_NAME["unicode-emoji"]
 
         text = unicode_fixture["input"]
-        digest = hash_string(text, Algorithm.XXH3_128, encoding="utf-8")
+        digest = hash_string(text, _XXH3, encoding="utf-8")
 
         assert digest.formatted == unicode_fixture["xxh3_128"]
 
@@ -118,11 +117,10 @@ class TestFixtureEdgeCases:
 
     def test_binary_sequence(self):
         """Test raw binary data."""
-        # Find binary-sequence fixture
-        binary_fixture = next(f for f in BLOCK_FIXTURES if f["name"] == "binary-sequence")
+        binary_fixture = BLOCK_FIXTURES_BY_NAME["binary-sequence"]
 
         data = bytes(binary_fixture["input_bytes"])
-        digest = hash_bytes(data, Algorithm.XXH3_128)
+        digest = hash_bytes(data, _XXH3)
 
         assert digest.formatted == binary_fixture["xxh3_128"]
 
@@ -133,19 +131,19 @@ class TestDefaultAlgorithm:
     def test_default_is_xxh3_128(self):
         """Test that default algorithm is XXH3-128."""
         digest = hash_bytes(b"test")
-        assert digest.algorithm == Algorithm.XXH3_128
+        assert digest.algorithm == _XXH3
 
         digest_str = hash_string("test")
-        assert digest_str.algorithm == Algorithm.XXH3_128
+        assert digest_str.algorithm == _XXH3
 
     def test_explicit_algorithm_override(self):
         """Test explicit algorithm selection."""
         data = b"test"
 
-        digest_xxh3 = hash_bytes(data, Algorithm.XXH3_128)
-        digest_sha256 = hash_bytes(data, Algorithm.SHA256)
+        digest_xxh3 = hash_bytes(data, _XXH3)
+        digest_sha256 = hash_bytes(data, _SHA)
 
         # Different algorithms produce different results
         assert digest_xxh3.hex != digest_sha256.hex
-        assert digest_xxh3.algorithm == Algorithm.XXH3_128
-        assert digest_sha256.algorithm == Algorithm.SHA256
+        assert digest_xxh3.algorithm == _XXH3
+        assert digest_sha256.algorithm == _SHA
@@ -4,10 +4,9 @@ Validates format_checksum, parse_checksum, validate_checksum_string,
 and compare_digests functions against format fixtures and error cases.
 """
 
-from pathlib import Path
+import re
 
 import pytest
-import yaml
 
 from pyfulmen.fulhash import (
     Algorithm,
@@ -25,14 +24,27 @@ from pyfulmen.fulhash import (
     validate_checksum_string,
 )
 
-# Load fixtures once at module level
-FIXTURES_PATH = Path("config/crucible-py/library/fulhash/fixtures.yaml")
-with open(FIXTURES_PATH) as f:
-    FIXTURES_DATA = yaml.safe_load(f)
+from .crucible_fixtures import load_fulhash_fixtures
+
+FIXTURES_DATA = load_fulhash_fixtures()
 
 FORMAT_FIXTURES = FIXTURES_DATA["format_fixtures"]
 ERROR_FIXTURES = FIXTURES_DATA["error_fixtures"]
 
+# Filtered parametrize lists, computed once at import
+FORMAT_ONLY_FIXTURES = [f for f in FORMAT_FIXTURES if f["name"].startswith("format-")]
+PARSE_ONLY_FIXTURES = [f for f in FORMAT_FIXTURES if f["name"].startswith("parse-")]
+CHECKSUM_ERROR_FIXTURES = [f for f in ERROR_FIXTURES if "checksum" in f]
+ALGORITHM_ERROR_FIXTURES = [f for f in ERROR_FIXTURES if "algorithm" in f]
+EXPECTED_FORMATTED_FIXTURES = [f for f in FORMAT_FIXTURES if "expected_formatted" in f]
+FORMATTED_INPUT_FIXTURES = [f for f in FORMAT_FIXTURES if "formatted" in f]
+
+# Error messages matched by several tests, compiled once
+_RE_UNSUPPORTED_MD5 = re.compile("Unsupported algorithm: md5")
+_RE_INVALID_HEX = re.compile("Invalid hex format")
+_RE_XXH3_HEX_LENGTH = re.compile("32 hex characters")
+_RE_EXPECTED_FORMAT = re.compile("expected format 'algorithm:hex'")
+
 
 class TestFormatChecksum:
     """Test format_checksum() function."""
@@ -65,7 +77,7 @@ class TestFormatChecksum:
 
     @pytest.mark.parametrize(
         "fixture",
-        [f for f in FORMAT_FIXTURES if f["name"].startswith("format-")],
+        FORMAT_ONLY_FIXTURES,
         ids=lambda f: f["name"],
     )
     def test_format_fixtures(self, fixture):
@@ -75,24 +87,29 @@ class TestFormatChecksum:
 
     def test_format_unsupported_algorithm(self):
         """Test formatting with unsupported algorithm."""
-        with pytest.raises(ValueError, match="Unsupported algorithm: md5"):
+        with pytest.raises(ValueError, match=_RE_UNSUPPORTED_MD5):
             format_checksum("md5", "abc123def456")
 
     def test_format_invalid_hex_uppercase(self):
         """Test formatting rejects uppercase hex."""
-        with pytest.raises(ValueError, match="Invalid hex format"):
+        with pytest.raises(ValueError, match=_RE_INVALID_HEX):
             format_checksum("xxh3-128", "A1B2C3D4E5F6A7B8C9D0E1F2A3B4C5D6")
 
     def test_format_invalid_hex_length(self):
         """Test formatting rejects wrong hex length."""
-        with pytest.raises(ValueError, match="32 hex characters"):
+        with pytest.raises(ValueError, match=_RE_XXH3_HEX_LENGTH):
             format_checksum("xxh3-128", "abc123")
 
     def test_format_invalid_hex_chars(self):
         """Test formatting rejects non-hex characters."""
-        with pytest.raises(ValueError, match="Invalid hex format"):
+        with pytest.raises(ValueError, match=_RE_INVALID_HEX):
             format_checksum("xxh3-128", "zzzzzzzzzzzzzzzzzzzzzzzzzzzzzzzz")
 
+    def test_format_invalid_hex_trailing_newline(self):
+        """Test formatting rejects a trailing newline padding the hex length."""
+        with pytest.raises(ValueError, match=_RE_INVALID_HEX):
+            format_checksum("xxh3-128", "a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d\n")
+
 
 class TestParseChecksum:
     """Test parse_checksum() function."""
@@ -111,7 +128,7 @@ class TestParseChecksum:
 
     @pytest.mark.parametrize(
         "fixture",
-        [f for f in FORMAT_FIXTURES if f["name"].startswith("parse-")],
+        PARSE_ONLY_FIXTURES,
         ids=lambda f: f["name"],
     )
     def test_parse_fixtures(self, fixture):
@@ -128,22 +145,22 @@ class TestParseChecksum:
 
     def test_parse_invalid_no_separator(self):
         """Test parsing rejects missing colon separator."""
-        with pytest.raises(ValueError, match="expected format 'algorithm:hex'"):
+        with pytest.raises(ValueError, match=_RE_EXPECTED_FORMAT):
             parse_checksum("invalid-no-separator")
 
     def test_parse_invalid_algorithm(self):
         """Test parsing rejects unsupported algorithm."""
-        with pytest.raises(ValueError, match="Unsupported algorithm: md5"):
+        with pytest.raises(ValueError, match=_RE_UNSUPPORTED_MD5):
             parse_checksum("md5:abc123def456")
 
     def test_parse_invalid_hex_uppercase(self):
         """Test parsing rejects uppercase hex."""
-        with pytest.raises(ValueError, match="Invalid hex format"):
+        with pytest.raises(ValueError, match=_RE_INVALID_HEX):
             parse_checksum("xxh3-128:A1B2C3D4E5F6A7B8C9D0E1F2A3B4C5D6")
 
     def test_parse_invalid_hex_length(self):
         """Test parsing rejects wrong hex length."""
-        with pytest.raises(ValueError, match="32 hex characters"):
+        with pytest.raises(ValueError, match=_RE_XXH3_HEX_LENGTH):
             parse_checksum("xxh3-128:abc123")
 
     def test_parse_roundtrip(self):
@@ -197,35 +214,47 @@ class TestValidateChecksumString:
         """Test validation rejects empty string."""
         assert not validate_checksum_string("")
 
-    @pytest.mark.parametrize(
-        "fixture",
-        FORMAT_FIXTURES,
-        ids=lambda f: f["name"],
+    @pytest.mark.parametrize("fixture", EXPECTED_FORMATTED_FIXTURES, ids=lambda f: f["name"])
+    def test_validate_expected_formatted_fixtures(self, fixture):
+        """Test validation accepts every expected_formatted fixture value."""
+        assert validate_checksum_string(fixture["expected_formatted"])
+
+    @pytest.mark.parametrize("fixture", FORMATTED_INPUT_FIXTURES, ids=lambda f: f["name"])
+    def test_validate_formatted_fixtures(self, fixture):
+        """Test validation accepts every formatted fixture input."""
+        assert validate_checksum_string(fixture["formatted"])
+
+
+@pytest.fixture(scope="class")
+def hello_digest():
+    """Digest of b"Hello, World!", computed once per test class."""
+    return hash_bytes(b"Hello, World!")
+
+
+@pytest.fixture
+def constructed_digests():
+    """Two equal digests built with model_construct (validation skipped).
+
+    Isolates compare_digests from Pydantic validator cost; inputs are
+    known-good, so this is only for exercising the comparison path.
+    """
+    hex_digest = "a1b2c3d4e5f6a7b8c9d0e1f2a3b4c5d6"
+    return (
+        Digest.model_construct(algorithm=Algorithm.XXH3_128, hex=hex_digest),
+        Digest.model_construct(algorithm=Algorithm.XXH3_128, hex=hex_digest),
     )
-    def test_validate_all_format_fixtures(self, fixture):
-        """Test validation accepts all format fixtures."""
-        if "expected_formatted" in fixture:
-            assert validate_checksum_string(fixture["expected_formatted"])
-        if "formatted" in fixture:
-            assert validate_checksum_string(fixture["formatted"])
 
 
 class TestCompareDigests:
     """Test compare_digests() function."""
 
-    def test_compare_identical_digests(self):
+    def test_compare_identical_digests(self, hello_digest):
         """Test comparison of identical digests."""
-        digest1 = hash_bytes(b"Hello, World!")
-        digest2 = hash_bytes(b"Hello, World!")
-
-        assert compare_digests(digest1, digest2)
+        assert compare_digests(hello_digest, hash_bytes(b"Hello, World!"))
 
-    def test_compare_different_data(self):
+    def test_compare_different_data(self, hello_digest):
         """Test comparison of different data."""
-        digest1 = hash_bytes(b"Hello, World!")
-        digest2 = hash_bytes(b"Different data")
-
-        assert not compare_digests(digest1, digest2)
+        assert not compare_digests(hello_digest, hash_bytes(b"Different data"))
 
     def test_compare_different_algorithms(self):
         """Test comparison of different algorithms."""
@@ -234,10 +263,9 @@ class TestCompareDigests:
 
         assert not compare_digests(digest_xxh3, digest_sha)
 
-    def test_compare_same_instance(self):
+    def test_compare_same_instance(self, hello_digest):
         """Test comparison of same instance."""
-        digest = hash_bytes(b"test")
-        assert compare_digests(digest, digest)
+        assert compare_digests(hello_digest, hello_digest)
 
     def test_compare_manually_constructed(self):
         """Test comparison of manually constructed digests."""
@@ -252,6 +280,13 @@ class TestCompareDigests:
 
         assert compare_digests(digest1, digest2)
 
+    def test_compare_construct_fastpath(self, constructed_digests):
+        """Test comparison of digests built without validation."""
+        digest1, digest2 = constructed_digests
+
+        assert compare_digests(digest1, digest2)
+        assert not compare_digests(digest1, hash_bytes(b"Hello, World!"))
+
     def test_compare_with_bytes_field(self):
         """Test comparison uses hex field (bytes field is optional)."""
         # One with bytes, one without
@@ -300,17 +335,17 @@ class TestParseDigest:
 
     def test_parse_digest_invalid_format(self):
         """Test parse_digest rejects missing separator."""
-        with pytest.raises(InvalidChecksumFormatError, match="expected format 'algorithm:hex'"):
+        with pytest.raises(InvalidChecksumFormatError, match=_RE_EXPECTED_FORMAT):
             parse_digest("invalid-no-separator")
 
     def test_parse_digest_unsupported_algorithm(self):
         """Test parse_digest rejects unsupported algorithm."""
-        with pytest.raises(UnsupportedAlgorithmError, match="Unsupported algorithm: md5"):
+        with pytest.raises(UnsupportedAlgorithmError, match=_RE_UNSUPPORTED_MD5):
             parse_digest("md5:abc123def456")
 
     def test_parse_digest_invalid_hex_length(self):
         """Test parse_digest rejects wrong hex length."""
-        with pytest.raises(ValueError, match="32 hex characters"):
+        with pytest.raises(ValueError, match=_RE_XXH3_HEX_LENGTH):
             parse_digest("xxh3-128:abc123")
 
 
@@ -362,7 +397,7 @@ class TestErrorFixtures:
 
     @pytest.mark.parametrize(
         "fixture",
-        [f for f in ERROR_FIXTURES if "checksum" in f],
+        CHECKSUM_ERROR_FIXTURES,
         ids=lambda f: f"{f['name']}-parse_checksum",
     )
     def test_error_fixtures_parse_checksum(self, fixture):
@@ -377,7 +412,7 @@ class TestErrorFixtures:
 
     @pytest.mark.parametrize(
         "fixture",
-        [f for f in ERROR_FIXTURES if "checksum" in f],
+        CHECKSUM_ERROR_FIXTURES,
         ids=lambda f: f"{f['name']}-parse_digest",
     )
     def test_error_fixtures_parse_digest(self, fixture):
@@ -392,7 +427,7 @@ class TestErrorFixtures:
 
     @pytest.mark.parametrize(
         "fixture",
-        [f for f in ERROR_FIXTURES if "algorithm" in f],
+        ALGORITHM_ERROR_FIXTURES,
         ids=lambda f: f"{f['name']}-format_checksum",
     )
     def test_error_fixtures_format_checksum(self, fixture):
@@ -407,7 +442,7 @@ class TestErrorFixtures:
 
     @pytest.mark.parametrize(
         "fixture",
-        [f for f in ERROR_FIXTURES if "algorithm" in f],
+        ALGORITHM_ERROR_FIXTURES,
         ids=lambda f: f"{f['name']}-hash_bytes",
     )
     def test_error_fixtures_hash_path(self, fixture):
@@ -420,35 +455,6 @@ class TestErrorFixtures:
         for substring in fixture["error_message_contains"]:
             assert substring.lower() in error
 
-    def test_unsupported_algorithm_format(self):
-        """Test unsupported algorithm in format_checksum."""
-        with pytest.raises(ValueError) as exc_info:
-            format_checksum("md5", "abc123def456789")
-
-        error = str(exc_info.value)
-        assert "md5" in error
-        assert "supported algorithms" in error.lower()
-        assert "xxh3-128" in error
-        assert "sha256" in error
-
-    def test_unsupported_algorithm_parse(self):
-        """Test unsupported algorithm in parse_checksum."""
-        with pytest.raises(ValueError) as exc_info:
-            parse_checksum("unknown:abc123")
-
-        error = str(exc_info.value)
-        assert "unknown" in error
-        assert "supported algorithms" in error.lower()
-
-    def test_invalid_checksum_format_parse(self):
-        """Test invalid format in parse_checksum."""
-        with pytest.raises(ValueError) as exc_info:
-            parse_checksum("invalid-no-separator")
-
-        error = str(exc_info.value)
-        assert "expected format" in error.lower()
-        assert "algorithm:hex" in error
-
 
 class TestHelperIntegration:
     """Test integration between helpers."""
@@ -10,9 +10,25 @@ from pyfulmen.fulhash import (
     Digest,
     InvalidChecksumError,
     UnsupportedAlgorithmError,
+    validate_checksum_string,
 )
 from pyfulmen.schema.validator import validate_against_schema
 
+XXH3_HEX = "531df2844447dd5077db03842cd75395"
+SHA256_HEX = "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+
+
+@pytest.fixture(scope="module")
+def xxh3_digest():
+    """Validated xxh3-128 Digest without bytes (frozen, safe to share)."""
+    return Digest(algorithm=Algorithm.XXH3_128, hex=XXH3_HEX)
+
+
+@pytest.fixture(scope="module")
+def sha256_digest():
+    """Validated sha256 Digest without bytes (frozen, safe to share)."""
+    return Digest(algorithm=Algorithm.SHA256, hex=SHA256_HEX)
+
 
 class TestAlgorithm:
     """Test Algorithm enum."""
@@ -36,27 +52,19 @@ class TestAlgorithm:
 class TestDigestBasics:
     """Test basic Digest model functionality."""
 
-    def test_digest_xxh3_valid(self):
+    def test_digest_xxh3_valid(self, xxh3_digest):
         """Test valid xxh3-128 digest."""
-        digest = Digest(
-            algorithm=Algorithm.XXH3_128,
-            hex="531df2844447dd5077db03842cd75395",
-        )
-        assert digest.algorithm == Algorithm.XXH3_128
-        assert digest.hex == "531df2844447dd5077db03842cd75395"
-        assert digest.bytes is None
-        assert digest.formatted == "xxh3-128:531df2844447dd5077db03842cd75395"
+        assert xxh3_digest.algorithm == Algorithm.XXH3_128
+        assert xxh3_digest.hex == "531df2844447dd5077db03842cd75395"
+        assert xxh3_digest.bytes is None
+        assert xxh3_digest.formatted == "xxh3-128:531df2844447dd5077db03842cd75395"
 
-    def test_digest_sha256_valid(self):
+    def test_digest_sha256_valid(self, sha256_digest):
         """Test valid sha256 digest."""
-        digest = Digest(
-            algorithm=Algorithm.SHA256,
-            hex="dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f",
-        )
-        assert digest.algorithm == Algorithm.SHA256
-        assert digest.hex == "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
-        assert digest.bytes is None
-        assert digest.formatted == "sha256:dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+        assert sha256_digest.algorithm == Algorithm.SHA256
+        assert sha256_digest.hex == "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+        assert sha256_digest.bytes is None
+        assert sha256_digest.formatted == "sha256:dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
 
     def test_digest_with_bytes(self):
         """Test digest with bytes field."""
@@ -73,55 +81,29 @@ class TestDigestBasics:
 class TestDigestValidation:
     """Test Digest validation logic."""
 
-    def test_hex_length_xxh3_invalid(self):
-        """Test xxh3-128 with wrong hex length."""
-        with pytest.raises(ValidationError, match="32 hex characters"):
-            Digest(
-                algorithm=Algorithm.XXH3_128,
-                hex="abc123",  # Too short
-            )
-
-    def test_hex_length_sha256_invalid(self):
-        """Test sha256 with wrong hex length."""
-        with pytest.raises(ValidationError, match="64 hex characters"):
-            Digest(
-                algorithm=Algorithm.SHA256,
-                hex="531df2844447dd5077db03842cd75395",  # 32 chars, need 64
-            )
-
-    def test_hex_uppercase_invalid(self):
-        """Test hex with uppercase letters (must be lowercase)."""
-        with pytest.raises(ValidationError, match="pattern"):
-            Digest(
-                algorithm=Algorithm.XXH3_128,
-                hex="531DF2844447DD5077DB03842CD75395",  # Uppercase
-            )
-
-    def test_hex_non_hex_chars(self):
-        """Test hex with non-hexadecimal characters."""
-        with pytest.raises(ValidationError, match="pattern"):
-            Digest(
-                algorithm=Algorithm.XXH3_128,
-                hex="xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx",
-            )
-
-    def test_bytes_length_xxh3_invalid(self):
-        """Test xxh3-128 with wrong bytes length."""
-        with pytest.raises(ValidationError, match="16 bytes"):
-            Digest(
-                algorithm=Algorithm.XXH3_128,
-                hex="531df2844447dd5077db03842cd75395",
-                bytes=b"tooshort",  # 8 bytes, need 16
-            )
-
-    def test_bytes_length_sha256_invalid(self):
-        """Test sha256 with wrong bytes length."""
-        with pytest.raises(ValidationError, match="32 bytes"):
-            Digest(
-                algorithm=Algorithm.SHA256,
-                hex="dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f",
-                bytes=b"S\x1d\xf2\x84DB}\xd5\x07}\xb0\x38B\xcdu\x95",  # 16 bytes, need 32
-            )
+    @pytest.mark.parametrize(
+        "algorithm, hex_digest, raw_bytes, match",
+        [
+            (Algorithm.XXH3_128, "abc123", None, "32 hex characters"),
+            (Algorithm.SHA256, XXH3_HEX, None, "64 hex characters"),
+            (Algorithm.XXH3_128, XXH3_HEX.upper(), None, "pattern"),
+            (Algorithm.XXH3_128, "x" * 32, None, "pattern"),
+            (Algorithm.XXH3_128, XXH3_HEX, b"tooshort", "16 bytes"),
+            (Algorithm.SHA256, SHA256_HEX, b"S\x1d\xf2\x84DB}\xd5\x07}\xb0\x38B\xcdu\x95", "32 bytes"),
+        ],
+        ids=[
+            "hex-length-xxh3",
+            "hex-length-sha256",
+            "hex-uppercase",
+            "hex-non-hex-chars",
+            "bytes-length-xxh3",
+            "bytes-length-sha256",
+        ],
+    )
+    def test_invalid_digest(self, algorithm, hex_digest, raw_bytes, match):
+        """Test invalid hex/bytes combinations are rejected."""
+        with pytest.raises(ValidationError, match=match):
+            Digest(algorithm=algorithm, hex=hex_digest, bytes=raw_bytes)
 
 
 class TestDigestImmutability:
@@ -153,58 +135,51 @@ class TestDigestImmutability:
 class TestDigestFormatted:
     """Test formatted property."""
 
-    def test_formatted_xxh3(self):
+    def test_formatted_xxh3(self, xxh3_digest):
         """Test formatted string for xxh3-128."""
-        digest = Digest(
-            algorithm=Algorithm.XXH3_128,
-            hex="531df2844447dd5077db03842cd75395",
-        )
-        assert digest.formatted == "xxh3-128:531df2844447dd5077db03842cd75395"
+        assert xxh3_digest.formatted == "xxh3-128:531df2844447dd5077db03842cd75395"
 
-    def test_formatted_sha256(self):
+    def test_formatted_sha256(self, sha256_digest):
         """Test formatted string for sha256."""
-        digest = Digest(
-            algorithm=Algorithm.SHA256,
-            hex="dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f",
-        )
-        assert digest.formatted == "sha256:dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+        assert sha256_digest.formatted == "sha256:dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
 
-    def test_formatted_matches_schema_pattern(self):
+    def test_formatted_matches_schema_pattern(self, xxh3_digest, sha256_digest):
         """Test formatted matches checksum-string.schema.json pattern."""
-        import re
+        assert validate_checksum_string(xxh3_digest.formatted)
+        assert validate_checksum_string(sha256_digest.formatted)
 
-        # Pattern from checksum-string.schema.json
-        pattern = r"^(xxh3-128:[0-9a-f]{32}|sha256:[0-9a-f]{64})$"
+    def test_formatted_is_cached(self):
+        """Test formatted is computed once and reused on later access."""
+        digest = Digest(algorithm=Algorithm.XXH3_128, hex=XXH3_HEX)
+        assert digest.formatted is digest.formatted
 
-        xxh3_digest = Digest(
-            algorithm=Algorithm.XXH3_128,
-            hex="531df2844447dd5077db03842cd75395",
-        )
-        assert re.match(pattern, xxh3_digest.formatted)
+    def test_cached_formatted_does_not_affect_equality(self):
+        """Test a digest with a cached formatted equals one without."""
+        cached = Digest(algorithm=Algorithm.XXH3_128, hex=XXH3_HEX)
+        _ = cached.formatted
+        assert cached == Digest(algorithm=Algorithm.XXH3_128, hex=XXH3_HEX)
 
-        sha256_digest = Digest(
-            algorithm=Algorithm.SHA256,
-            hex="dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f",
-        )
-        assert re.match(pattern, sha256_digest.formatted)
+    def test_model_copy_update_recomputes_formatted(self, xxh3_digest):
+        """Test model_copy(update=...) does not carry a stale formatted."""
+        _ = xxh3_digest.formatted
+        copied = xxh3_digest.model_copy(update={"algorithm": Algorithm.SHA256, "hex": SHA256_HEX})
+        assert copied.formatted == f"sha256:{SHA256_HEX}"
 
 
 class TestDigestSerialization:
     """Test Digest JSON serialization."""
 
-    def test_model_dump_json(self):
+    def test_model_dump_json(self, xxh3_digest):
         """Test Digest can be dumped to JSON."""
-        digest = Digest(
-            algorithm=Algorithm.XXH3_128,
-            hex="531df2844447dd5077db03842cd75395",
-        )
-        data = digest.model_dump(mode="json")
+        data = json.loads(xxh3_digest.model_dump_json())
 
         assert data["algorithm"] == "xxh3-128"
         assert data["hex"] == "531df2844447dd5077db03842cd75395"
         assert data["formatted"] == "xxh3-128:531df2844447dd5077db03842cd75395"
-        # None bytes is omitted entirely in JSON mode (never null)
+        # None bytes is omitted entirely in JSON mode (never null), for the
+        # JSON string and for model_dump(mode="json") alike
         assert "bytes" not in data
+        assert "bytes" not in xxh3_digest.model_dump(mode="json")
 
     def test_model_dump_json_with_bytes(self):
         """Test JSON mode serializes bytes as list[int]."""
@@ -4,20 +4,61 @@ Validates that StreamHasher produces identical results to block hashing
 and correctly handles chunked data, reset, and streaming fixtures.
 """
 
-from pathlib import Path
-
 import pytest
-import yaml
 
 from pyfulmen.fulhash import Algorithm, hash_bytes, stream
 
-# Load fixtures once at module level
-FIXTURES_PATH = Path("config/crucible-py/library/fulhash/fixtures.yaml")
-with open(FIXTURES_PATH) as f:
-    FIXTURES_DATA = yaml.safe_load(f)
+from .crucible_fixtures import load_fulhash_fixtures
+
+FIXTURES_DATA = load_fulhash_fixtures()
 
 BLOCK_FIXTURES = FIXTURES_DATA["fixtures"]
 STREAMING_FIXTURES = FIXTURES_DATA["streaming_fixtures"]
+BLOCK_FIXTURES_BY_NAME = {f["name"]: f for f in BLOCK_FIXTURES}
+STREAMING_FIXTURES_BY_NAME = {f["name"]: f for f in STREAMING_FIXTURES}
+
+# Bind hot enum members once instead of per test call
+_XXH3 = Algorithm.XXH3_128
+_SHA = Algorithm.SHA256
+_ALGORITHMS = (_XXH3, _SHA)
+
+# Text chunks of value-based streaming fixtures, encoded once at import
+STREAMING_TEXT_CHUNKS = {
+    f["name"]: [chunk["value"].encode(chunk["encoding"]) for chunk in f["chunks"]]
+    for f in STREAMING_FIXTURES
+    if all("value" in chunk for chunk in f["chunks"])
+}
+
+
+def _decode_input(fixture: dict) -> bytes:
+    """Return a block fixture's input as bytes."""
+    if "input" in fixture:
+        return fixture["input"].encode(fixture["encoding"])
+    if "input_bytes" in fixture:
+        return bytes(fixture["input_bytes"])
+    pytest.skip("No input data")
+
+
+_PATTERN_BYTES = {
+    "repeating-A": b"A",
+    "repeating-B": b"B",
+    "repeating-C": b"C",
+}
+
+# One shared slab per pattern; pattern chunks of any size are fed as views
+# into it, so peak memory stays at one slab rather than the chunk size.
+_SLAB_SIZE = 64 * 1024
+_PATTERN_SLABS = {pattern: byte * _SLAB_SIZE for pattern, byte in _PATTERN_BYTES.items()}
+
+
+def _feed_pattern(hasher, pattern: str, size: int) -> None:
+    """Feed ``size`` bytes of a streaming fixture pattern into ``hasher``."""
+    slab = memoryview(_PATTERN_SLABS[pattern])
+    full, remainder = divmod(size, _SLAB_SIZE)
+    for _ in range(full):
+        hasher.update(slab)
+    if remainder:
+        hasher.update(slab[:remainder])
 
 
 class TestStreamHasherBasics:
@@ -26,10 +67,10 @@ class TestStreamHasherBasics:
     def test_stream_factory(self):
         """Test stream() factory function."""
         hasher = stream()
-        assert hasher.algorithm == Algorithm.XXH3_128
+        assert hasher.algorithm == _XXH3
 
-        hasher_sha = stream(Algorithm.SHA256)
-        assert hasher_sha.algorithm == Algorithm.SHA256
+        hasher_sha = stream(_SHA)
+        assert hasher_sha.algorithm == _SHA
 
     def test_update_returns_self(self):
         """Test update() returns self for chaining."""
@@ -54,52 +95,33 @@ class TestStreamingVsBlock:
     """Test streaming produces same results as block hashing."""
 
     @pytest.mark.parametrize("fixture", BLOCK_FIXTURES, ids=lambda f: f["name"])
-    def test_xxh3_streaming_matches_block(self, fixture):
-        """Test XXH3-128 streaming matches block hashing."""
-        # Get input data
-        if "input" in fixture:
-            data = fixture["input"].encode(fixture["encoding"])
-        elif "input_bytes" in fixture:
-            data = bytes(fixture["input_bytes"])
-        else:
-            pytest.skip("No input data")
-
-        # Compute block hash
-        block_digest = hash_bytes(data, Algorithm.XXH3_128)
-
-        # Compute streaming hash
-        hasher = stream(Algorithm.XXH3_128)
-        hasher.update(data)
-        stream_digest = hasher.digest()
-
-        # Should be identical
-        assert stream_digest.formatted == block_digest.formatted
-        assert stream_digest.hex == block_digest.hex
-        assert stream_digest.bytes == block_digest.bytes
+    def test_streaming_matches_block(self, fixture):
+        """Test XXH3-128 and SHA-256 streaming match block hashing."""
+        # One zero-copy view shared by both paths (xxhash and hashlib take
+        # any buffer-protocol object)
+        data = memoryview(_decode_input(fixture))
+
+        for algorithm in _ALGORITHMS:
+            # Compute block hash
+            block_digest = hash_bytes(data, algorithm)
+
+            # Compute streaming hash
+            hasher = stream(algorithm)
+            hasher.update(data)
+            stream_digest = hasher.digest()
+
+            # Should be identical (Digest equality compares algorithm, hex, bytes)
+            assert stream_digest == block_digest
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview], ids=["bytearray", "memoryview"])
+    @pytest.mark.parametrize("algorithm", [_XXH3, _SHA, Algorithm.CRC32])
+    def test_buffer_protocol_input(self, wrap, algorithm):
+        """Test non-bytes buffers hash identically to bytes (CRC32C needs bytes)."""
+        data = b"Hello, World!"
+        expected = hash_bytes(data, algorithm)
 
-    @pytest.mark.parametrize("fixture", BLOCK_FIXTURES, ids=lambda f: f["name"])
-    def test_sha256_streaming_matches_block(self, fixture):
-        """Test SHA-256 streaming matches block hashing."""
-        # Get input data
-        if "input" in fixture:
-            data = fixture["input"].encode(fixture["encoding"])
-        elif "input_bytes" in fixture:
-            data = bytes(fixture["input_bytes"])
-        else:
-            pytest.skip("No input data")
-
-        # Compute block hash
-        block_digest = hash_bytes(data, Algorithm.SHA256)
-
-        # Compute streaming hash
-        hasher = stream(Algorithm.SHA256)
-        hasher.update(data)
-        stream_digest = hasher.digest()
-
-        # Should be identical
-        assert stream_digest.formatted == block_digest.formatted
-        assert stream_digest.hex == block_digest.hex
-        assert stream_digest.bytes == block_digest.bytes
+        assert hash_bytes(wrap(data), algorithm) == expected
+        assert stream(algorithm).update(wrap(data)).digest() == expected
 
 
 class TestStreamingFixtures:
@@ -107,59 +129,53 @@ class TestStreamingFixtures:
 
     def test_streaming_hello_world(self):
         """Test streaming hello-world fixture."""
-        fixture = next(f for f in STREAMING_FIXTURES if f["name"] == "streaming-hello-world")
+        fixture = STREAMING_FIXTURES_BY_NAME["streaming-hello-world"]
+        chunks = STREAMING_TEXT_CHUNKS["streaming-hello-world"]
 
         # XXH3-128
-        hasher_xxh3 = stream(Algorithm.XXH3_128)
-        for chunk in fixture["chunks"]:
-            data = chunk["value"].encode(chunk["encoding"])
-            hasher_xxh3.update(data)
+        hasher_xxh3 = stream(_XXH3)
+        for chunk in chunks:
+            hasher_xxh3.update(chunk)
 
         digest_xxh3 = hasher_xxh3.digest()
         assert digest_xxh3.formatted == fixture["expected_xxh3_128"]
 
         # SHA-256
-        hasher_sha = stream(Algorithm.SHA256)
-        for chunk in fixture["chunks"]:
-            data = chunk["value"].encode(chunk["encoding"])
-            hasher_sha.update(data)
+        hasher_sha = stream(_SHA)
+        for chunk in chunks:
+            hasher_sha.update(chunk)
 
         digest_sha = hasher_sha.digest()
         assert digest_sha.formatted == fixture["expected_sha256"]
 
     def test_streaming_large_chunks(self):
         """Test streaming large chunks fixture."""
-        fixture = next(f for f in STREAMING_FIXTURES if f["name"] == "streaming-large-chunks")
-
-        # Build chunks according to fixture spec
-        chunks = []
-        for chunk_spec in fixture["chunks"]:
-            size = chunk_spec["size"]
-            pattern = chunk_spec["pattern"]
-
-            if pattern == "repeating-A":
-                chunks.append(b"A" * size)
-            elif pattern == "repeating-B":
-                chunks.append(b"B" * size)
-            elif pattern == "repeating-C":
-                chunks.append(b"C" * size)
+        fixture = STREAMING_FIXTURES_BY_NAME["streaming-large-chunks"]
 
         # XXH3-128
-        hasher_xxh3 = stream(Algorithm.XXH3_128)
-        for chunk in chunks:
-            hasher_xxh3.update(chunk)
+        hasher_xxh3 = stream(_XXH3)
+        for spec in fixture["chunks"]:
+            _feed_pattern(hasher_xxh3, spec["pattern"], spec["size"])
 
         digest_xxh3 = hasher_xxh3.digest()
         assert digest_xxh3.formatted == fixture["expected_xxh3_128"]
 
         # SHA-256
-        hasher_sha = stream(Algorithm.SHA256)
-        for chunk in chunks:
-            hasher_sha.update(chunk)
+        hasher_sha = stream(_SHA)
+        for spec in fixture["chunks"]:
+            _feed_pattern(hasher_sha, spec["pattern"], spec["size"])
 
         digest_sha = hasher_sha.digest()
         assert digest_sha.formatted == fixture["expected_sha256"]
 
+    def test_feed_pattern_across_slabs(self):
+        """Test pattern feeding spanning several slabs matches block hashing."""
+        size = 2 * _SLAB_SIZE + 5
+        hasher = stream()
+        _feed_pattern(hasher, "repeating-A", size)
+
+        assert hasher.digest() == hash_bytes(b"A" * size)
+
 
 class TestStreamingChunks:
     """Test chunked updates."""
@@ -185,31 +201,31 @@ class TestStreamingChunks:
         """Test many small chunks."""
         data = b"Hello, World!"
 
-        # All at once
-        hasher1 = stream()
-        hasher1.update(data)
-        digest1 = hasher1.digest()
+        # Reference: block hash of the whole input
+        digest1 = hash_bytes(data)
 
-        # One byte at a time
+        # One byte at a time, as zero-copy memoryview slices
         hasher2 = stream()
-        for byte in data:
-            hasher2.update(bytes([byte]))
+        update = hasher2.update
+        view = memoryview(data)
+        for i in range(len(view)):
+            update(view[i : i + 1])
         digest2 = hasher2.digest()
 
         assert digest1.formatted == digest2.formatted
 
     def test_empty_updates(self):
         """Test that empty updates don't affect result."""
-        hasher1 = stream()
-        hasher1.update(b"Hello, World!")
-        digest1 = hasher1.digest()
+        # Reference: block hash of the concatenated non-empty chunks
+        digest1 = hash_bytes(b"Hello, World!")
 
         hasher2 = stream()
-        hasher2.update(b"")
-        hasher2.update(b"Hello, ")
-        hasher2.update(b"")
-        hasher2.update(b"World!")
-        hasher2.update(b"")
+        update = hasher2.update
+        update(b"")
+        update(b"Hello, ")
+        update(b"")
+        update(b"World!")
+        update(b"")
         digest2 = hasher2.digest()
 
         assert digest1.formatted == digest2.formatted
@@ -278,11 +294,11 @@ class TestStreamingEdgeCases:
 
     def test_empty_stream(self):
         """Test hashing with no updates (empty input)."""
-        hasher = stream(Algorithm.XXH3_128)
+        hasher = stream(_XXH3)
         digest = hasher.digest()
 
         # Should match empty-input fixture
-        empty_fixture = next(f for f in BLOCK_FIXTURES if f["name"] == "empty-input")
+        empty_fixture = BLOCK_FIXTURES_BY_NAME["empty-input"]
         assert digest.formatted == empty_fixture["xxh3_128"]
 
     def test_digest_multiple_calls(self):
@@ -304,12 +320,12 @@ class TestStreamingAlgorithms:
     def test_default_algorithm(self):
         """Test default algorithm is XXH3-128."""
         hasher = stream()
-        assert hasher.algorithm == Algorithm.XXH3_128
+        assert hasher.algorithm == _XXH3
 
     def test_explicit_algorithm(self):
         """Test explicit algorithm selection."""
-        hasher_xxh3 = stream(Algorithm.XXH3_128)
-        hasher_sha = stream(Algorithm.SHA256)
+        hasher_xxh3 = stream(_XXH3)
+        hasher_sha = stream(_SHA)
 
         hasher_xxh3.update(b"test")
         hasher_sha.update(b"test")
@@ -318,8 +334,8 @@ class TestStreamingAlgorithms:
         digest_sha = hasher_sha.digest()
 
         # Different algorithms produce different results
-        assert digest_xxh3.algorithm == Algorithm.XXH3_128
-        assert digest_sha.algorithm == Algorithm.SHA256
+        assert digest_xxh3.algorithm == _XXH3
+        assert digest_sha.algorithm == _SHA
         assert digest_xxh3.formatted != digest_sha.formatted
 
 
@@ -328,9 +344,9 @@ class TestTelemetry:
 
     def test_stream_with_telemetry_enabled(self):
         """Verify stream() executes with telemetry instrumentation."""
-        hasher = stream(Algorithm.XXH3_128)
+        hasher = stream(_XXH3)
         hasher.update(b"Telemetry test data")
         digest = hasher.digest()
 
         assert digest is not None
-        assert digest.algorithm == Algorithm.XXH3_128
+        assert digest.algorithm == _XXH3
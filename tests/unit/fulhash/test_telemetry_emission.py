@@ -14,6 +14,7 @@ from pyfulmen.fulhash import (
     Algorithm,
     hash_bytes,
     hash_file,
+    hash_many,
     hash_reader,
     hash_string,
     stream,
@@ -108,6 +109,24 @@ class TestHashBytesEmission:
         }
 
 
+class TestHashManyEmission:
+    """hash_many emits one set of metrics per batch, not per input."""
+
+    def test_emits_once_per_batch(self):
+        hash_many([b"one", b"two", b"three"])
+        events = _drain_fulhash_events()
+        _assert_only_taxonomy_names(events)
+        assert [e.name for e in events].count("fulhash_operation_ms") == 1
+        (ops_event,) = [e for e in events if e.name == "fulhash_operations_total_xxh3_128"]
+        (bytes_event,) = [e for e in events if e.name == "fulhash_bytes_hashed_total"]
+        assert ops_event.value >= 3
+        assert bytes_event.value >= 11
+
+    def test_empty_batch_emits_nothing(self):
+        hash_many([])
+        assert _drain_fulhash_events() == []
+
+
 class TestHashStringEmission:
     """hash_string adds the string-operations counter."""
 
@@ -1,7 +1,7 @@
 """Tests for the W2B verify/multi-hash/reader API surface.
 
 Covers verify_bytes/verify_text/verify_file/verify_reader,
-multi_hash_bytes/_text/_file/_reader, hash_reader, the reader contract
+multi_hash_bytes/_text/_file/_reader, hash_many, hash_reader, the reader contract
 (non-seekable support, text-mode rejection), chunk_size validation, and
 the verify()/multi_hash() str-branch deprecation warnings.
 """
@@ -17,6 +17,7 @@ from pyfulmen.fulhash import (
     UnsupportedAlgorithmError,
     hash_bytes,
     hash_file,
+    hash_many,
     hash_reader,
     hash_string,
     multi_hash,
@@ -292,6 +293,32 @@ class TestMultiHashVariants:
             multi_hash_reader(io.BytesIO(DATA), self.ALGOS, chunk_size=-5)
 
 
+class TestHashMany:
+    """Test hash_many() batch hashing."""
+
+    INPUTS = [b"", b"Hello, World!", DATA, bytes(range(256))]
+
+    @pytest.mark.parametrize("algo", [Algorithm.XXH3_128, Algorithm.SHA256, Algorithm.CRC32, Algorithm.CRC32C])
+    def test_matches_hash_bytes(self, algo):
+        digests = hash_many(self.INPUTS, algo)
+        assert digests == [hash_bytes(data, algo) for data in self.INPUTS]
+
+    def test_default_algorithm(self):
+        (digest,) = hash_many([DATA])
+        assert digest.formatted == DATA_XXH3
+
+    def test_accepts_generator(self):
+        digests = hash_many(data for data in self.INPUTS)
+        assert [d.hex for d in digests] == [hash_bytes(data).hex for data in self.INPUTS]
+
+    def test_empty_batch(self):
+        assert hash_many([]) == []
+
+    def test_unsupported_algorithm(self):
+        with pytest.raises(UnsupportedAlgorithmError):
+            hash_many([DATA], "md5")  # type: ignore[arg-type]
+
+
 class TestDispatcherDeprecation:
     """Test verify()/multi_hash() dispatchers and str-branch deprecation."""
 
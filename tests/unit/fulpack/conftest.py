@@ -0,0 +1,24 @@
+"""Shared pytest fixtures for fulpack tests."""
+
+import pytest
+
+# Contents of the shared source tree, keyed by file name
+_SHARED_FILES = {
+    "file1.txt": b"a",
+    "file2.txt": b"b",
+    "test.txt": b"content",
+}
+
+
+@pytest.fixture(scope="session")
+def shared_source(tmp_path_factory):
+    """Small read-only source tree, created once per session.
+
+    Tests archive it but must not modify it; archive outputs and extraction
+    destinations belong under the per-test ``tmp_path``.
+    """
+    source_dir = tmp_path_factory.mktemp("fulpack") / "source"
+    source_dir.mkdir()
+    for name, data in _SHARED_FILES.items():
+        (source_dir / name).write_bytes(data)
+    return source_dir
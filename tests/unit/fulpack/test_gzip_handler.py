@@ -7,20 +7,35 @@ from pyfulmen.fulpack.exceptions import FulpackError
 from pyfulmen.fulpack.formats.gzip import GzipHandler
 
 
+@pytest.fixture(scope="module")
+def gzip_handler():
+    """GzipHandler is stateless beyond its format, so one instance is shared."""
+    return GzipHandler(ArchiveFormat.GZIP)
+
+
+@pytest.fixture
+def gzip_archive(tmp_path, gzip_handler):
+    """Single-file gzip archive of ``test.txt`` containing ``content``."""
+    source_file = tmp_path / "test.txt"
+    source_file.write_bytes(b"content")
+
+    archive_path = tmp_path / "test.txt.gz"
+    gzip_handler.create([str(source_file)], str(archive_path), {})
+    return gzip_handler, source_file, archive_path
+
+
 class TestGzipHandler:
     """Test GZIP format handler."""
 
-    def test_gzip_create_and_info(self, tmp_path):
+    def test_gzip_create_and_info(self, tmp_path, gzip_handler):
         """Test creating and inspecting a gzip archive."""
-        handler = GzipHandler(ArchiveFormat.GZIP)
-
         # Create test file
         source_file = tmp_path / "file.txt"
         source_file.write_text("Hello World")
 
         # Create archive
         archive_path = tmp_path / "file.txt.gz"
-        info = handler.create(
+        info = gzip_handler.create(
             source=[str(source_file)],
             output=str(archive_path),
             options={},
@@ -32,42 +47,31 @@ class TestGzipHandler:
         assert info.compression_ratio is not None and info.compression_ratio > 0
 
         # Get info
-        info2 = handler.info(str(archive_path))
+        info2 = gzip_handler.info(str(archive_path))
         assert info2.entry_count == 1
         assert info2.format == "gzip"
 
-    def test_gzip_create_fail_multiple(self, tmp_path):
+    def test_gzip_create_fail_multiple(self, tmp_path, gzip_handler):
         """Test that creating gzip from multiple files fails."""
-        handler = GzipHandler(ArchiveFormat.GZIP)
-
         f1 = tmp_path / "f1"
         f1.touch()
         f2 = tmp_path / "f2"
         f2.touch()
 
         with pytest.raises(FulpackError, match="single file"):
-            handler.create([str(f1), str(f2)], str(tmp_path / "out.gz"), {})
+            gzip_handler.create([str(f1), str(f2)], str(tmp_path / "out.gz"), {})
 
-    def test_gzip_create_fail_directory(self, tmp_path):
+    def test_gzip_create_fail_directory(self, tmp_path, gzip_handler):
         """Test that creating gzip from directory fails."""
-        handler = GzipHandler(ArchiveFormat.GZIP)
-
         d = tmp_path / "dir"
         d.mkdir()
 
         with pytest.raises(FulpackError, match="directories"):
-            handler.create([str(d)], str(tmp_path / "out.gz"), {})
+            gzip_handler.create([str(d)], str(tmp_path / "out.gz"), {})
 
-    def test_gzip_extract(self, tmp_path):
+    def test_gzip_extract(self, tmp_path, gzip_archive):
         """Test extracting a gzip archive."""
-        handler = GzipHandler(ArchiveFormat.GZIP)
-
-        # Create archive
-        source_file = tmp_path / "test.txt"
-        source_file.write_text("content")
-
-        archive_path = tmp_path / "test.txt.gz"
-        handler.create([str(source_file)], str(archive_path), {})
+        handler, _, archive_path = gzip_archive
 
         # Extract
         dest_dir = tmp_path / "dest"
@@ -77,35 +81,22 @@ class TestGzipHandler:
         assert result.extracted_count == 1
         assert result.error_count == 0
         assert (dest_dir / "test.txt").exists()
-        assert (dest_dir / "test.txt").read_text() == "content"
+        assert (dest_dir / "test.txt").read_bytes() == b"content"
 
-    def test_gzip_scan(self, tmp_path):
+    def test_gzip_scan(self, gzip_archive):
         """Test scanning gzip archive."""
-        handler = GzipHandler(ArchiveFormat.GZIP)
-
-        # Create archive
-        source_file = tmp_path / "data.csv"
-        source_file.write_text("a,b,c")
-
-        archive_path = tmp_path / "data.csv.gz"
-        handler.create([str(source_file)], str(archive_path), {})
+        handler, _, archive_path = gzip_archive
 
         # Scan
         entries = handler.scan(str(archive_path), {})
 
         assert len(entries) == 1
-        assert entries[0].path == "data.csv"
+        assert entries[0].path == "test.txt"
         assert entries[0].size > 0
 
-    def test_gzip_verify(self, tmp_path):
+    def test_gzip_verify(self, gzip_archive):
         """Test gzip verification."""
-        handler = GzipHandler(ArchiveFormat.GZIP)
-
-        # Create archive
-        source_file = tmp_path / "test.txt"
-        source_file.write_text("content")
-        archive_path = tmp_path / "test.txt.gz"
-        handler.create([str(source_file)], str(archive_path), {})
+        handler, _, archive_path = gzip_archive
 
         # Verify
         result = handler.verify(str(archive_path))
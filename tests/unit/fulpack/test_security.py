@@ -1,7 +1,6 @@
 """Unit tests for fulpack security utilities."""
 
-import tempfile
-from pathlib import Path
+import logging
 
 import pytest
 
@@ -23,167 +22,149 @@ from pyfulmen.fulpack.security import (
 class TestNormalizePath:
     """Test path normalization."""
 
-    def test_simple_path(self):
-        """Test simple path normalization."""
-        assert normalize_path("foo/bar") == "foo/bar"
-
-    def test_current_dir(self):
-        """Test current directory normalization."""
-        assert normalize_path("foo/./bar") == "foo/bar"
-
-    def test_parent_dir(self):
-        """Test parent directory normalization."""
-        assert normalize_path("foo/../bar") == "bar"
-
-    def test_multiple_slashes(self):
-        """Test multiple slashes normalization."""
-        assert normalize_path("foo//bar///baz") == "foo/bar/baz"
-
-    def test_absolute_path(self):
-        """Test absolute path normalization."""
-        result = normalize_path("/foo/bar/../baz")
-        assert result == "/foo/baz"
-
-    def test_trailing_slash(self):
-        """Test trailing slash removal."""
-        assert normalize_path("foo/bar/") == "foo/bar"
-
-    def test_empty_after_normalization(self):
-        """Test paths that normalize to empty."""
-        assert normalize_path(".") == "."
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("foo/bar", "foo/bar"),
+            ("foo/./bar", "foo/bar"),
+            ("foo/../bar", "bar"),
+            ("foo//bar///baz", "foo/bar/baz"),
+            ("/foo/bar/../baz", "/foo/baz"),
+            ("foo/bar/", "foo/bar"),
+            (".", "."),
+        ],
+        ids=[
+            "simple",
+            "current_dir",
+            "parent_dir",
+            "multiple_slashes",
+            "absolute",
+            "trailing_slash",
+            "dot",
+        ],
+    )
+    def test_normalize_path(self, raw, expected):
+        """Test path normalization cases."""
+        assert normalize_path(raw) == expected
+
+
+@pytest.fixture(scope="module")
+def base_dir(tmp_path_factory):
+    """Read-only base directory shared by the string-only path validation tests."""
+    return str(tmp_path_factory.mktemp("base"))
 
 
 class TestValidatePathTraversal:
     """Test path traversal validation."""
 
-    def test_valid_path(self):
+    def test_valid_path(self, base_dir):
         """Test valid path passes validation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            validate_path_traversal("foo/bar.txt", tmpdir)  # Should not raise
+        validate_path_traversal("foo/bar.txt", base_dir)  # Should not raise
 
-    def test_absolute_path_rejected(self):
+    def test_absolute_path_rejected(self, base_dir):
         """Test absolute paths are rejected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(PathTraversalError) as exc_info:
-                validate_path_traversal("/etc/passwd", tmpdir)
-            assert "absolute path" in str(exc_info.value)
-            assert exc_info.value.context["attack_type"] == "absolute_path"
+        with pytest.raises(PathTraversalError) as exc_info:
+            validate_path_traversal("/etc/passwd", base_dir)
+        assert "absolute path" in str(exc_info.value)
+        assert exc_info.value.context["attack_type"] == "absolute_path"
 
-    def test_symlink_based_escape(self):
+    def test_symlink_based_escape(self, tmp_path):
         """Test that actual symlink-based escapes would be caught.
 
         Note: Our normalization strips leading .. which makes normalized
         paths safe. Real escapes would need to use symlinks, which are
         caught by validate_symlink_target().
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create structure: tmpdir/subdir/file.txt
-            subdir = Path(tmpdir) / "subdir"
-            subdir.mkdir()
+        # Create structure: tmp_path/subdir/file.txt
+        (tmp_path / "subdir").mkdir()
 
-            # Path like "subdir/../../etc" resolves to "etc" which is within base
-            # This is secure normalization behavior
-            validate_path_traversal("subdir/../../etc/passwd", tmpdir)
+        # Path like "subdir/../../etc" resolves to "etc" which is within base
+        # This is secure normalization behavior
+        validate_path_traversal("subdir/../../etc/passwd", str(tmp_path))
 
-    def test_parent_escape_normalized_safe(self):
+    def test_parent_escape_normalized_safe(self, base_dir):
         """Test that paths with .. that normalize within base are allowed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # ../../../etc/passwd normalizes to just "etc/passwd" which is safe
-            # This is correct behavior - normalization removes leading ../
-            validate_path_traversal("../../../etc/passwd", tmpdir)
+        # ../../../etc/passwd normalizes to just "etc/passwd" which is safe
+        # This is correct behavior - normalization removes leading ../
+        validate_path_traversal("../../../etc/passwd", base_dir)
 
-            # foo/../../bar normalizes to "bar" which is safe
-            validate_path_traversal("foo/../../bar", tmpdir)
+        # foo/../../bar normalizes to "bar" which is safe
+        validate_path_traversal("foo/../../bar", base_dir)
 
-    def test_complex_valid_path(self):
+    def test_complex_valid_path(self, base_dir):
         """Test complex but valid path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # foo/../bar resolves to just 'bar' which is valid
-            validate_path_traversal("foo/../bar/baz.txt", tmpdir)
+        # foo/../bar resolves to just 'bar' which is valid
+        validate_path_traversal("foo/../bar/baz.txt", base_dir)
 
 
 class TestValidateSymlinkTarget:
     """Test symlink validation."""
 
-    def test_valid_relative_target(self):
+    def test_valid_relative_target(self, base_dir):
         """Test valid relative symlink target."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            validate_symlink_target("link.txt", "target.txt", tmpdir)
+        validate_symlink_target("link.txt", "target.txt", base_dir)
 
-    def test_absolute_target_rejected(self):
+    def test_absolute_target_rejected(self, base_dir):
         """Test absolute targets are rejected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(SymlinkError) as exc_info:
-                validate_symlink_target("link.txt", "/etc/passwd", tmpdir)
-            assert "absolute target" in str(exc_info.value)
+        with pytest.raises(SymlinkError) as exc_info:
+            validate_symlink_target("link.txt", "/etc/passwd", base_dir)
+        assert "absolute target" in str(exc_info.value)
 
-    def test_escape_target_rejected(self):
+    def test_escape_target_rejected(self, base_dir):
         """Test escape targets are rejected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(SymlinkError) as exc_info:
-                validate_symlink_target("link.txt", "../../../etc/passwd", tmpdir)
-            assert "resolves outside base" in str(exc_info.value)
+        with pytest.raises(SymlinkError) as exc_info:
+            validate_symlink_target("link.txt", "../../../etc/passwd", base_dir)
+        assert "resolves outside base" in str(exc_info.value)
 
-    def test_valid_nested_symlink(self):
+    def test_valid_nested_symlink(self, base_dir):
         """Test valid nested symlink."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            validate_symlink_target("foo/link.txt", "../bar/target.txt", tmpdir)
+        validate_symlink_target("foo/link.txt", "../bar/target.txt", base_dir)
+
+
+# Sizes well within the default limits; rejection cases override single fields
+_NORMAL_ENTRY = {
+    "entry_size": 100_000,
+    "compressed_size": 10_000,
+    "total_size": 100_000,
+    "entry_count": 1,
+}
 
 
 class TestCheckDecompressionBomb:
     """Test decompression bomb detection."""
 
+    @pytest.fixture(autouse=True)
+    def _warn_level(self, caplog):
+        """Capture the compression-ratio warnings emitted by the checks."""
+        caplog.set_level(logging.WARNING)
+
     def test_normal_entry(self):
         """Test normal entry passes checks."""
-        check_decompression_bomb(
-            entry_size=100_000,
-            compressed_size=10_000,
-            total_size=100_000,
-            entry_count=1,
-        )
-
-    def test_oversized_entry_rejected(self):
-        """Test oversized entry is rejected."""
-        with pytest.raises(DecompressionBombError) as exc_info:
-            check_decompression_bomb(
-                entry_size=2_000_000_000,  # 2 GB > 1 GB limit
-                compressed_size=10_000,
-                total_size=2_000_000_000,
-                entry_count=1,
-            )
-        assert "entry size" in str(exc_info.value)
-        assert exc_info.value.context["attack_type"] == "oversized_entry"
-
-    def test_oversized_total_rejected(self):
-        """Test oversized total is rejected."""
+        check_decompression_bomb(**_NORMAL_ENTRY)
+
+    @pytest.mark.parametrize(
+        "override,message,attack_type",
+        [
+            # 2 GB > 1 GB limit
+            ({"entry_size": 2_000_000_000, "total_size": 2_000_000_000}, "entry size", "oversized_entry"),
+            # 15 GB > 10 GB limit
+            ({"total_size": 15_000_000_000, "entry_count": 100_000}, "total size", "oversized_total"),
+            # > 100k limit
+            ({"entry_count": 150_000}, "entry count", "too_many_entries"),
+            # Custom lower limit
+            ({"max_entry_size": 50_000}, "entry size", "oversized_entry"),
+        ],
+        ids=["oversized_entry", "oversized_total", "too_many_entries", "custom_limits"],
+    )
+    def test_rejected(self, override, message, attack_type):
+        """Test entries exceeding a limit are rejected."""
         with pytest.raises(DecompressionBombError) as exc_info:
-            check_decompression_bomb(
-                entry_size=100_000,
-                compressed_size=10_000,
-                total_size=15_000_000_000,  # 15 GB > 10 GB limit
-                entry_count=100_000,
-            )
-        assert "total size" in str(exc_info.value)
-        assert exc_info.value.context["attack_type"] == "oversized_total"
-
-    def test_too_many_entries_rejected(self):
-        """Test too many entries is rejected."""
-        with pytest.raises(DecompressionBombError) as exc_info:
-            check_decompression_bomb(
-                entry_size=100_000,
-                compressed_size=10_000,
-                total_size=100_000,
-                entry_count=150_000,  # > 100k limit
-            )
-        assert "entry count" in str(exc_info.value)
-        assert exc_info.value.context["attack_type"] == "too_many_entries"
+            check_decompression_bomb(**{**_NORMAL_ENTRY, **override})
+        assert message in str(exc_info.value)
+        assert exc_info.value.context["attack_type"] == attack_type
 
     def test_high_compression_ratio_warns(self, caplog):
         """Test high compression ratio generates warning."""
-        import logging
-
-        caplog.set_level(logging.WARNING)
-
         check_decompression_bomb(
             entry_size=1_000_000,  # 1 MB
             compressed_size=5_000,  # 5 KB -> 200:1 ratio
@@ -195,110 +176,70 @@ class TestCheckDecompressionBomb:
         assert "Suspicious compression ratio" in caplog.text
         assert "200" in caplog.text  # Ratio should be mentioned
 
-    def test_custom_limits(self):
-        """Test custom limits are respected."""
-        # Should fail with custom lower limit
-        with pytest.raises(DecompressionBombError):
-            check_decompression_bomb(
-                entry_size=100_000,
-                compressed_size=10_000,
-                total_size=100_000,
-                entry_count=1,
-                max_entry_size=50_000,  # Lower limit
-            )
+
+_HEX = frozenset("0123456789abcdef")
+
+# SHA-256 of the checksum_file content (b"test content\n")
+CHECKSUM_FILE_SHA256 = "a1fff0ffefb9eace7230c24e50731f0a91c62f9cefdfe77121c2f607125dffae"
+
+
+@pytest.fixture
+def checksum_file(tmp_path):
+    """Small file with known content for checksum tests."""
+    path = tmp_path / "checksum.txt"
+    path.write_bytes(b"test content\n")
+    return path
 
 
 class TestChecksums:
     """Test checksum computation and verification."""
 
-    def test_compute_checksum_sha256(self):
-        """Test SHA-256 checksum computation."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("test content\n")
-            path = f.name
-
-        try:
-            # Empty file has known SHA-256
-            checksum = compute_checksum(path, "sha256")
-            assert len(checksum) == 64  # SHA-256 is 64 hex chars
-            assert all(c in "0123456789abcdef" for c in checksum)
-        finally:
-            Path(path).unlink()
-
-    def test_compute_checksum_sha512(self):
-        """Test SHA-512 checksum computation."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("test")
-            path = f.name
-
-        try:
-            checksum = compute_checksum(path, "sha512")
-            assert len(checksum) == 128  # SHA-512 is 128 hex chars
-        finally:
-            Path(path).unlink()
-
-    def test_compute_checksum_unsupported_algorithm(self):
+    @pytest.mark.parametrize(
+        "algorithm,hex_length",
+        [
+            ("sha256", 64),  # SHA-256 is 64 hex chars
+            ("sha512", 128),  # SHA-512 is 128 hex chars
+        ],
+        ids=["sha256", "sha512"],
+    )
+    def test_compute_checksum(self, checksum_file, algorithm, hex_length):
+        """Test SHA-2 checksum computation."""
+        checksum = compute_checksum(str(checksum_file), algorithm)
+        assert len(checksum) == hex_length
+        assert set(checksum) <= _HEX
+
+    def test_compute_checksum_unsupported_algorithm(self, checksum_file):
         """Test unsupported algorithm raises error."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            path = f.name
-
-        try:
-            with pytest.raises(ValueError) as exc_info:
-                compute_checksum(path, "blake2b")
-            assert "Unsupported hash algorithm" in str(exc_info.value)
-        finally:
-            Path(path).unlink()
+        with pytest.raises(ValueError) as exc_info:
+            compute_checksum(str(checksum_file), "blake2b")
+        assert "Unsupported hash algorithm" in str(exc_info.value)
 
-    def test_verify_checksum_match(self):
+    def test_verify_checksum_match(self, checksum_file):
         """Test checksum verification with matching checksum."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("test content\n")
-            path = f.name
+        path = str(checksum_file)
+        expected = compute_checksum(path, "sha256")
+        assert verify_checksum(path, expected, "sha256") is True
 
-        try:
-            expected = compute_checksum(path, "sha256")
-            assert verify_checksum(path, expected, "sha256") is True
-        finally:
-            Path(path).unlink()
-
-    def test_verify_checksum_mismatch(self):
+    def test_verify_checksum_mismatch(self, checksum_file):
         """Test checksum verification with mismatched checksum."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("test")
-            path = f.name
-
-        try:
-            wrong_checksum = "0" * 64
-            assert verify_checksum(path, wrong_checksum, "sha256") is False
-        finally:
-            Path(path).unlink()
+        wrong_checksum = "0" * 64
+        assert verify_checksum(str(checksum_file), wrong_checksum, "sha256") is False
 
-    def test_verify_checksum_case_insensitive(self):
+    def test_verify_checksum_case_insensitive(self, checksum_file):
         """Test checksum verification is case-insensitive."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("test")
-            path = f.name
-
-        try:
-            checksum = compute_checksum(path, "sha256")
-            assert verify_checksum(path, checksum.upper(), "sha256") is True
-            assert verify_checksum(path, checksum.lower(), "sha256") is True
-        finally:
-            Path(path).unlink()
-
-    def test_compute_checksum_fulhash_algorithms(self):
+        path = str(checksum_file)
+        assert verify_checksum(path, CHECKSUM_FILE_SHA256.upper(), "sha256") is True
+        assert verify_checksum(path, CHECKSUM_FILE_SHA256.lower(), "sha256") is True
+
+    def test_compute_checksum_fulhash_algorithms(self, tmp_path):
         """Test compute_checksum delegates to fulhash for xxh3-128 and crc32."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("123456789")
-            path = f.name
-
-        try:
-            # CRC32
-            crc = compute_checksum(path, "crc32")
-            assert crc == "cbf43926"
-
-            # XXH3-128
-            xxh = compute_checksum(path, "xxh3-128")
-            assert len(xxh) == 32
-        finally:
-            Path(path).unlink()
+        path = tmp_path / "check.txt"
+        path.write_bytes(b"123456789")
+
+        # CRC32
+        crc = compute_checksum(str(path), "crc32")
+        assert crc == "cbf43926"
+
+        # XXH3-128
+        xxh = compute_checksum(str(path), "xxh3-128")
+        assert len(xxh) == 32
@@ -1,27 +1,37 @@
 """Unit tests for TAR handler."""
 
+from pathlib import PurePosixPath
+
+import pytest
+
 from crucible.fulpack import ArchiveFormat
 from pyfulmen.fulpack.formats.tar import TarHandler
 
 
+@pytest.fixture(scope="module")
+def tar_archive(tmp_path_factory, shared_source):
+    """Uncompressed tar archive of ``shared_source``, created once per module.
+
+    extract/scan/verify behave the same for TAR and TAR_GZ, so the read-side
+    tests skip the gzip layer; test_tar_gz_create_and_info covers TAR_GZ.
+    """
+    archive_path = tmp_path_factory.mktemp("tar") / "test.tar"
+    TarHandler(ArchiveFormat.TAR).create([shared_source], archive_path, {})
+    return archive_path
+
+
 class TestTarHandler:
     """Test TAR and TAR.GZ format handler."""
 
-    def test_tar_gz_create_and_info(self, tmp_path):
+    def test_tar_gz_create_and_info(self, tmp_path, shared_source):
         """Test creating and inspecting a tar.gz archive."""
         handler = TarHandler(ArchiveFormat.TAR_GZ)
 
-        # Create test files
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "file1.txt").write_text("Hello")
-        (source_dir / "file2.txt").write_text("World")
-
         # Create archive
         archive_path = tmp_path / "test.tar.gz"
         info = handler.create(
-            source=[str(source_dir)],
-            output=str(archive_path),
+            source=[shared_source],
+            output=archive_path,
             options={},
         )
 
@@ -47,8 +57,8 @@ class TestTarHandler:
         # Create archive
         archive_path = tmp_path / "test.tar"
         info = handler.create(
-            source=[str(source_dir)],
-            output=str(archive_path),
+            source=[source_dir],
+            output=archive_path,
             options={},
         )
 
@@ -58,61 +68,36 @@ class TestTarHandler:
         # Compression ratio = total_size / compressed_size, so it will be < 1 for small files
         assert info.compression_ratio is not None and info.compression_ratio > 0
 
-    def test_extract(self, tmp_path):
+    def test_extract(self, tmp_path, tar_archive):
         """Test extracting an archive."""
-        handler = TarHandler(ArchiveFormat.TAR_GZ)
-
-        # Create archive
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "test.txt").write_text("content")
-
-        archive_path = tmp_path / "test.tar.gz"
-        handler.create([str(source_dir)], str(archive_path), {})
+        handler = TarHandler(ArchiveFormat.TAR)
 
         # Extract
         dest_dir = tmp_path / "dest"
-        result = handler.extract(str(archive_path), str(dest_dir), {})
+        result = handler.extract(str(tar_archive), str(dest_dir), {})
 
         assert result.extracted_count >= 1
         assert result.error_count == 0
         assert (dest_dir / "source" / "test.txt").exists()
 
-    def test_scan(self, tmp_path):
+    def test_scan(self, tar_archive):
         """Test scanning archive entries."""
-        handler = TarHandler(ArchiveFormat.TAR_GZ)
-
-        # Create archive with multiple files
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "file1.txt").write_text("a")
-        (source_dir / "file2.txt").write_text("b")
-
-        archive_path = tmp_path / "test.tar.gz"
-        handler.create([str(source_dir)], str(archive_path), {})
+        handler = TarHandler(ArchiveFormat.TAR)
 
         # Scan
-        entries = handler.scan(str(archive_path), {})
+        entries = handler.scan(str(tar_archive), {})
 
         assert len(entries) >= 2
-        entry_names = [e.path for e in entries]
-        assert any("file1.txt" in name for name in entry_names)
-        assert any("file2.txt" in name for name in entry_names)
+        basenames = {PurePosixPath(e.path).name for e in entries}
+        assert "file1.txt" in basenames
+        assert "file2.txt" in basenames
 
-    def test_verify(self, tmp_path):
+    def test_verify(self, tar_archive):
         """Test archive verification."""
-        handler = TarHandler(ArchiveFormat.TAR_GZ)
-
-        # Create valid archive
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "test.txt").write_text("content")
-
-        archive_path = tmp_path / "test.tar.gz"
-        handler.create([str(source_dir)], str(archive_path), {})
+        handler = TarHandler(ArchiveFormat.TAR)
 
         # Verify
-        result = handler.verify(str(archive_path))
+        result = handler.verify(str(tar_archive))
 
         assert result.valid is True
         assert result.entry_count >= 1
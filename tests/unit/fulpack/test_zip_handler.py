@@ -1,27 +1,33 @@
 """Unit tests for ZIP handler."""
 
+from pathlib import PurePosixPath
+
+import pytest
+
 from crucible.fulpack import ArchiveFormat
 from pyfulmen.fulpack.formats.zip import ZipHandler
 
 
+@pytest.fixture(scope="module")
+def zip_archive(tmp_path_factory, shared_source):
+    """zip archive of ``shared_source``, created once per module."""
+    archive_path = tmp_path_factory.mktemp("zip") / "test.zip"
+    ZipHandler(ArchiveFormat.ZIP).create([shared_source], archive_path, {})
+    return archive_path
+
+
 class TestZipHandler:
     """Test ZIP format handler."""
 
-    def test_zip_create_and_info(self, tmp_path):
+    def test_zip_create_and_info(self, tmp_path, shared_source):
         """Test creating and inspecting a zip archive."""
         handler = ZipHandler(ArchiveFormat.ZIP)
 
-        # Create test files
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "file1.txt").write_text("Hello")
-        (source_dir / "file2.txt").write_text("World")
-
         # Create archive
         archive_path = tmp_path / "test.zip"
         info = handler.create(
-            source=[str(source_dir)],
-            output=str(archive_path),
+            source=[shared_source],
+            output=archive_path,
             options={},
         )
 
@@ -35,61 +41,36 @@ class TestZipHandler:
         assert info2.entry_count == info.entry_count
         assert info2.format == "zip"
 
-    def test_zip_extract(self, tmp_path):
+    def test_zip_extract(self, tmp_path, zip_archive):
         """Test extracting a zip archive."""
         handler = ZipHandler(ArchiveFormat.ZIP)
 
-        # Create archive
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "test.txt").write_text("content")
-
-        archive_path = tmp_path / "test.zip"
-        handler.create([str(source_dir)], str(archive_path), {})
-
         # Extract
         dest_dir = tmp_path / "dest"
-        result = handler.extract(str(archive_path), str(dest_dir), {})
+        result = handler.extract(str(zip_archive), str(dest_dir), {})
 
         assert result.extracted_count >= 1
         assert result.error_count == 0
         assert (dest_dir / "source" / "test.txt").exists()
 
-    def test_zip_scan(self, tmp_path):
+    def test_zip_scan(self, zip_archive):
         """Test scanning zip archive entries."""
         handler = ZipHandler(ArchiveFormat.ZIP)
 
-        # Create archive with multiple files
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "file1.txt").write_text("a")
-        (source_dir / "file2.txt").write_text("b")
-
-        archive_path = tmp_path / "test.zip"
-        handler.create([str(source_dir)], str(archive_path), {})
-
         # Scan
-        entries = handler.scan(str(archive_path), {})
+        entries = handler.scan(str(zip_archive), {})
 
         assert len(entries) >= 2
-        entry_names = [e.path for e in entries]
-        assert any("file1.txt" in name for name in entry_names)
-        assert any("file2.txt" in name for name in entry_names)
+        basenames = {PurePosixPath(e.path).name for e in entries}
+        assert "file1.txt" in basenames
+        assert "file2.txt" in basenames
 
-    def test_zip_verify(self, tmp_path):
+    def test_zip_verify(self, zip_archive):
         """Test zip archive verification."""
         handler = ZipHandler(ArchiveFormat.ZIP)
 
-        # Create valid archive
-        source_dir = tmp_path / "source"
-        source_dir.mkdir()
-        (source_dir / "test.txt").write_text("content")
-
-        archive_path = tmp_path / "test.zip"
-        handler.create([str(source_dir)], str(archive_path), {})
-
         # Verify
-        result = handler.verify(str(archive_path))
+        result = handler.verify(str(zip_archive))
 
         assert result.valid is True
         assert result.entry_count >= 1
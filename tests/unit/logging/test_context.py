@@ -1,8 +1,11 @@
 """Tests for correlation context management (Phase 3)."""
 
+import asyncio
 import json
 import threading
 
+import pytest
+
 from pyfulmen.logging import Logger, LoggingProfile
 from pyfulmen.logging.context import (
     clear_context,
@@ -10,11 +13,25 @@ from pyfulmen.logging.context import (
     extract_correlation_id_from_headers,
     get_context,
     get_correlation_id,
+    run_with_current_context,
     set_context_value,
     set_correlation_id,
 )
 
 
+@pytest.fixture(autouse=True)
+def _reset_context():
+    """Start and end every test with no correlation ID or context values.
+
+    Cleanup runs even when a test fails, so state never leaks into later tests.
+    """
+    set_correlation_id(None)
+    clear_context()
+    yield
+    set_correlation_id(None)
+    clear_context()
+
+
 class TestCorrelationID:
     """Test correlation ID management."""
 
@@ -78,6 +95,18 @@ class TestContext:
         clear_context()
         assert get_context() == {}
 
+    def test_get_context_is_read_only(self):
+        """get_context() should not allow writes that bypass set_context_value()."""
+        clear_context()
+        set_context_value("key", "value")
+
+        context = get_context()
+        with pytest.raises(TypeError):
+            context["other"] = "value"  # type: ignore[index]
+
+        assert dict(context) == {"key": "value"}
+        clear_context()
+
     def test_set_and_get_context_value(self):
         """set_context_value() should store values in context."""
         clear_context()
@@ -128,6 +157,60 @@ class TestContext:
         # Cleanup
         clear_context()
 
+    def test_context_isolated_per_asyncio_task(self):
+        """Tasks should see a snapshot of the creating context, not later writes."""
+        clear_context()
+        set_correlation_id(None)
+
+        async def task_func(task_id):
+            set_correlation_id(task_id)
+            # The context is shared with the parent until replaced, so it must
+            # not be writable through get_context()
+            with pytest.raises(TypeError):
+                get_context()["leak"] = task_id  # type: ignore[index]
+            set_context_value("task", task_id)
+            await asyncio.sleep(0)
+            return get_correlation_id(), dict(get_context())
+
+        async def main():
+            set_context_value("parent", "value")
+            results = await asyncio.gather(task_func("task-a"), task_func("task-b"))
+            return results, dict(get_context())
+
+        results, parent_context = asyncio.run(main())
+
+        assert results[0] == ("task-a", {"parent": "value", "task": "task-a"})
+        assert results[1] == ("task-b", {"parent": "value", "task": "task-b"})
+        assert parent_context == {"parent": "value"}
+        # asyncio.run executes in a copy of this context, so nothing leaks back
+        assert get_correlation_id() is None
+        assert get_context() == {}
+
+    def test_run_with_current_context_isolates_changes(self):
+        """The callable sees the caller's context, but its writes stay in the copy."""
+        seen = []
+
+        def func():
+            seen.append((get_correlation_id(), get_context().copy()))
+            set_correlation_id("inner-id")
+            set_context_value("inner_key", "inner_value")
+
+        with correlation_context(correlation_id="outer-id", request="r1"):
+            run_with_current_context(func)
+
+            assert get_correlation_id() == "outer-id"
+            assert get_context() == {"request": "r1"}
+
+        assert seen == [("outer-id", {"request": "r1"})]
+
+    def test_run_with_current_context_returns_result(self):
+        """The callable's return value and keyword arguments pass through."""
+        set_correlation_id("direct-id")
+
+        result = run_with_current_context(lambda prefix, *, sep: f"{prefix}{sep}{get_correlation_id()}", "id", sep="=")
+
+        assert result == "id=direct-id"
+
 
 class TestCorrelationContext:
     """Test correlation_context context manager."""
@@ -180,6 +263,28 @@ class TestCorrelationContext:
         # Should clear completely
         assert get_correlation_id() is None
 
+    def test_correlation_context_discards_values_set_inside(self):
+        """Values set within the block should not outlive it."""
+        clear_context()
+
+        with correlation_context():
+            set_context_value("inner_key", "inner_value")
+            assert get_context()["inner_key"] == "inner_value"
+
+        assert "inner_key" not in get_context()
+
+    def test_correlation_context_restores_context_cleared_inside(self):
+        """Clearing the context within the block should be undone on exit."""
+        clear_context()
+        set_context_value("outer_key", "outer_value")
+
+        with correlation_context():
+            clear_context()
+            assert get_context() == {}
+
+        assert get_context() == {"outer_key": "outer_value"}
+        clear_context()
+
     def test_correlation_context_preserves_existing_context(self):
         """correlation_context should preserve existing context on exit."""
         set_correlation_id("original-id")
@@ -282,6 +387,15 @@ class TestLoggerCorrelationIntegration:
         # Explicit should win
         assert log_line["context"]["key"] == "explicit-value"
 
+    def test_logging_does_not_mutate_context(self, capsys):
+        """Emitting a log should leave the active context untouched."""
+        logger = Logger(service="test", profile=LoggingProfile.STRUCTURED)
+
+        with correlation_context(user_id="user-333"):
+            logger.info("Message", context={"request_id": "req-444"})
+            logger.info("Message")
+            assert get_context() == {"user_id": "user-333"}
+
     def test_multiple_logs_same_correlation_id(self, capsys):
         """Multiple logs in same context should share correlation_id."""
         logger = Logger(service="test", profile=LoggingProfile.STRUCTURED)
@@ -326,6 +440,12 @@ class TestHeaderExtraction:
         corr_id = extract_correlation_id_from_headers(headers)
         assert corr_id == "request-789"
 
+    def test_extract_from_request_id(self):
+        """Should extract from bare Request-Id as the last default fallback."""
+        headers = {"request-id": "bare-321"}
+        corr_id = extract_correlation_id_from_headers(headers)
+        assert corr_id == "bare-321"
+
     def test_extract_priority_order(self):
         """X-Correlation-ID should take precedence over X-Request-ID."""
         headers = {
@@ -0,0 +1,33 @@
+"""Tests for log event formatters."""
+
+import json
+
+from pyfulmen.logging.formatter import JSONFormatter
+
+EVENT = {"severity": "INFO", "message": "café"}
+
+
+class TestJSONFormatter:
+    """Test JSONFormatter output options."""
+
+    def test_compact_output_by_default(self):
+        """Default output should be compact single-line JSON."""
+        assert JSONFormatter().format(EVENT) == '{"severity":"INFO","message":"café"}'
+
+    def test_indent_change_after_init_applies(self):
+        """Changing indent after construction should affect later output."""
+        formatter = JSONFormatter()
+        formatter.indent = 2
+
+        output = formatter.format(EVENT)
+
+        assert output == json.dumps(EVENT, ensure_ascii=False, indent=2)
+        assert formatter.indent == 2
+
+    def test_ensure_ascii_change_after_init_applies(self):
+        """Changing ensure_ascii after construction should affect later output."""
+        formatter = JSONFormatter()
+        formatter.ensure_ascii = True
+
+        assert "caf\\u00e9" in formatter.format(EVENT)
+        assert formatter.ensure_ascii is True
@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from pyfulmen.logging import Logger
 from pyfulmen.logging.severity import Severity
 
@@ -113,6 +115,29 @@ class TestLevelFiltering:
         result = captured.err
         assert "Logged" in result
 
+    @pytest.mark.parametrize(
+        "level",
+        ["VERBOSE", "debug", 20, None],
+        ids=["unknown-name", "lowercase-name", "int", "none"],
+    )
+    def test_set_level_rejects_invalid_level(self, level):
+        """set_level() should raise ValueError for anything but a Severity or its exact name."""
+        logger = Logger(service="test", profile="SIMPLE")
+
+        with pytest.raises(ValueError, match="not a valid Severity"):
+            logger.set_level(level)
+
+        assert logger.default_level == "INFO"
+
+    def test_set_level_and_log_agree_on_level_names(self):
+        """set_level() and log() should reject the same level names."""
+        logger = Logger(service="test", profile="SIMPLE")
+
+        with pytest.raises(ValueError):
+            logger.log("info", "message")
+        with pytest.raises(ValueError):
+            logger.set_level("info")
+
     def test_trace_level_logs_everything(self, capsys):
         """TRACE level should log all messages."""
         logger = Logger(service="test", profile="STRUCTURED", default_level="TRACE")
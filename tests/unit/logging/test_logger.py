@@ -5,7 +5,7 @@ import json
 import pytest
 
 from pyfulmen.logging._models import LoggingConfig, LoggingPolicy, LoggingProfile
-from pyfulmen.logging.logger import Logger, ProgressiveLogger
+from pyfulmen.logging.logger import LazyValue, Logger, ProgressiveLogger
 from pyfulmen.logging.severity import Severity
 from pyfulmen.logging.throttling import ThrottlingMiddleware
 
@@ -185,6 +185,29 @@ class TestProgressiveLogger:
         assert parsed["context"]["method"] == "GET"
         assert parsed["context"]["path"] == "/api/users"
 
+    def test_lazy_values_skipped_when_filtered(self, capsys):
+        """LazyValue factories should not run for calls below the level."""
+        logger = Logger(service="test", profile=LoggingProfile.STRUCTURED)
+        calls = []
+
+        logger.debug("Filtered", context={"state": LazyValue(lambda: calls.append("called"))})
+
+        assert calls == []
+        assert capsys.readouterr().err == ""
+
+    def test_lazy_values_resolved_when_emitted(self, capsys):
+        """LazyValue fields and context values should be rendered when emitted."""
+        logger = Logger(service="test", profile=LoggingProfile.STRUCTURED)
+        context = {"method": "GET", "count": LazyValue(lambda: 3)}
+
+        logger.info("Request received", user_id=LazyValue(lambda: "user-456"), context=context)
+
+        parsed = json.loads(capsys.readouterr().err.strip())
+        assert parsed["userId"] == "user-456"
+        assert parsed["context"] == {"method": "GET", "count": 3}
+        # The caller's context dict is left untouched
+        assert isinstance(context["count"], LazyValue)
+
     def test_set_level(self):
         """Test dynamic level changing."""
         logger = Logger(service="test", default_level="INFO")
@@ -550,3 +573,18 @@ class TestTelemetry:
         events = telemetry.drain_events()
         assert len([e for e in events if e.name == "logging_emit_count"]) == 3
         assert len([e for e in events if e.name == "logging_emit_latency_ms"]) == 3
+
+    def test_filtered_log_calls_count_without_latency(self):
+        """Verify calls below the configured level are counted but not timed."""
+        from pyfulmen import telemetry
+        from pyfulmen.logging import Logger
+
+        logger = Logger(service="test", default_level="ERROR")
+        telemetry.drain_events()
+        logger.debug("Filtered")
+        logger.info("Filtered")
+        logger.log("WARN", "Filtered")
+
+        events = telemetry.drain_events()
+        assert len([e for e in events if e.name == "logging_emit_count"]) == 3
+        assert not [e for e in events if e.name == "logging_emit_latency_ms"]
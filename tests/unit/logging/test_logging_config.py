@@ -1,5 +1,10 @@
 """Unit tests for logging config module."""
 
+import threading
+from dataclasses import asdict, replace
+
+import pytest
+
 from pyfulmen.logging.config import (
     LoggerConfig,
     MiddlewareConfig,
@@ -16,82 +21,113 @@ from pyfulmen.logging.profiles import LoggingProfile
 class TestSinkConfig:
     """Test SinkConfig dataclass."""
 
-    def test_minimal_sink_config(self):
-        """Test sink config with minimal fields."""
-        sink = SinkConfig(type="console")
-        assert sink.type == "console"
-        assert sink.name is None
-        assert sink.level is None
-        assert sink.format == "json"
-        assert sink.options is None
-
-    def test_full_sink_config(self):
-        """Test sink config with all fields."""
-        sink = SinkConfig(
-            type="rolling-file",
-            name="app-logs",
-            level="INFO",
-            format="json",
-            options={"maxSize": "100MB", "maxBackups": 5},
-        )
-        assert sink.type == "rolling-file"
-        assert sink.name == "app-logs"
-        assert sink.level == "INFO"
-        assert sink.format == "json"
-        assert sink.options == {"maxSize": "100MB", "maxBackups": 5}
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"type": "console"},
+                {"type": "console", "name": None, "level": None, "format": "json", "options": None},
+            ),
+            (
+                {
+                    "type": "rolling-file",
+                    "name": "app-logs",
+                    "level": "INFO",
+                    "format": "json",
+                    "options": {"maxSize": "100MB", "maxBackups": 5},
+                },
+                {
+                    "type": "rolling-file",
+                    "name": "app-logs",
+                    "level": "INFO",
+                    "format": "json",
+                    "options": {"maxSize": "100MB", "maxBackups": 5},
+                },
+            ),
+        ],
+        ids=["minimal", "full"],
+    )
+    def test_sink_config(self, kwargs, expected):
+        """Test sink config fields and defaults."""
+        assert asdict(SinkConfig(**kwargs)) == expected
+
+    def test_sink_config_is_mutable(self):
+        """Test sink config fields can be updated after construction."""
+        sink = SinkConfig(type="console", format="json")
+        sink.level = "DEBUG"
+        assert sink.level == "DEBUG"
 
 
 class TestMiddlewareConfig:
     """Test MiddlewareConfig dataclass."""
 
-    def test_minimal_middleware_config(self):
-        """Test middleware config with minimal fields."""
-        mw = MiddlewareConfig(name="correlation")
-        assert mw.name == "correlation"
-        assert mw.enabled is True
-        assert mw.order == 0
-        assert mw.config is None
-
-    def test_full_middleware_config(self):
-        """Test middleware config with all fields."""
-        mw = MiddlewareConfig(
-            name="redaction",
-            enabled=True,
-            order=10,
-            config={"patterns": ["api_key", "password"]},
-        )
-        assert mw.name == "redaction"
-        assert mw.enabled is True
-        assert mw.order == 10
-        assert mw.config == {"patterns": ["api_key", "password"]}
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"name": "correlation"},
+                {"name": "correlation", "enabled": True, "order": 0, "config": None},
+            ),
+            (
+                {
+                    "name": "redaction",
+                    "enabled": True,
+                    "order": 10,
+                    "config": {"patterns": ["api_key", "password"]},
+                },
+                {
+                    "name": "redaction",
+                    "enabled": True,
+                    "order": 10,
+                    "config": {"patterns": ["api_key", "password"]},
+                },
+            ),
+        ],
+        ids=["minimal", "full"],
+    )
+    def test_middleware_config(self, kwargs, expected):
+        """Test middleware config fields and defaults."""
+        assert asdict(MiddlewareConfig(**kwargs)) == expected
 
 
 class TestThrottlingConfig:
     """Test ThrottlingConfig dataclass."""
 
-    def test_disabled_throttling(self):
-        """Test throttling config disabled."""
-        throttle = ThrottlingConfig()
-        assert throttle.enabled is False
-        assert throttle.maxRate is None
-        assert throttle.burstSize is None
-        assert throttle.windowSize is None
-        assert throttle.dropPolicy == "drop-oldest"
-
-    def test_enabled_throttling(self):
-        """Test throttling config enabled with settings."""
-        throttle = ThrottlingConfig(
-            enabled=True,
-            maxRate=1000,
-            burstSize=100,
-            windowSize=60,
-            dropPolicy="drop-newest",
-        )
-        assert throttle.enabled is True
-        assert throttle.maxRate == 1000
-        assert throttle.burstSize == 100
-        assert throttle.windowSize == 60
-        assert throttle.dropPolicy == "drop-newest"
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {},
+                {
+                    "enabled": False,
+                    "maxRate": None,
+                    "burstSize": None,
+                    "windowSize": None,
+                    "dropPolicy": "drop-oldest",
+                },
+            ),
+            (
+                {
+                    "enabled": True,
+                    "maxRate": 1000,
+                    "burstSize": 100,
+                    "windowSize": 60,
+                    "dropPolicy": "drop-newest",
+                },
+                {
+                    "enabled": True,
+                    "maxRate": 1000,
+                    "burstSize": 100,
+                    "windowSize": 60,
+                    "dropPolicy": "drop-newest",
+                },
+            ),
+        ],
+        ids=["disabled", "enabled"],
+    )
+    def test_throttling_config(self, kwargs, expected):
+        """Test throttling config fields and defaults."""
+        assert asdict(ThrottlingConfig(**kwargs)) == expected
 
 
 class TestLoggerConfig:
@@ -139,14 +175,28 @@ class TestLoggerConfig:
         assert config.enableStacktrace is True
 
 
+@pytest.fixture(scope="module")
+def base_config():
+    """Valid STRUCTURED config; tests derive variants with ``replace``.
+
+    validate_logger_config only reads the config, so the shared sinks list is
+    safe to reuse across variants.
+    """
+    return LoggerConfig(
+        profile=LoggingProfile.STRUCTURED,
+        service="test-service",
+        sinks=[SinkConfig(type="console", format="json")],
+    )
+
+
 class TestValidateLoggerConfig:
     """Test validate_logger_config function."""
 
-    def test_valid_simple_config(self):
+    def test_valid_simple_config(self, base_config):
         """Test validation of valid SIMPLE config."""
-        config = LoggerConfig(
+        config = replace(
+            base_config,
             profile=LoggingProfile.SIMPLE,
-            service="test-service",
             sinks=[SinkConfig(type="console", format="text")],
         )
         errors = validate_logger_config(config)
@@ -161,60 +211,62 @@ class TestValidateLoggerConfig:
         errors = validate_logger_config(config)
         assert "Service name is required" in errors
 
-    def test_valid_structured_config(self):
-        """Test validation of valid STRUCTURED config."""
-        config = LoggerConfig(
-            profile=LoggingProfile.STRUCTURED,
-            service="test-service",
-            sinks=[SinkConfig(type="console", format="json")],
-        )
+    def test_missing_service_name_structured(self, base_config):
+        """Test validation fails for missing service name with sinks configured."""
+        config = replace(base_config, service="")
         errors = validate_logger_config(config)
+        assert "Service name is required" in errors
+
+    def test_valid_structured_config(self, base_config):
+        """Test validation of valid STRUCTURED config."""
+        errors = validate_logger_config(base_config)
         assert errors == []
 
-    def test_valid_enterprise_config(self):
+    def test_valid_enterprise_config(self, base_config):
         """Test validation of valid ENTERPRISE config."""
-        config = LoggerConfig(
+        config = replace(
+            base_config,
             profile=LoggingProfile.ENTERPRISE,
-            service="test-service",
-            sinks=[SinkConfig(type="console", format="json")],
             middleware=[MiddlewareConfig(name="correlation")],
             policyFile="/etc/fulmen/logging-policy.yaml",
         )
         errors = validate_logger_config(config)
         assert errors == []
 
-    def test_enterprise_missing_middleware(self):
+    def test_enterprise_missing_middleware(self, base_config):
         """Test ENTERPRISE profile requires middleware."""
-        config = LoggerConfig(
+        config = replace(
+            base_config,
             profile=LoggingProfile.ENTERPRISE,
-            service="test-service",
-            sinks=[SinkConfig(type="console", format="json")],
             policyFile="/etc/fulmen/logging-policy.yaml",
         )
         errors = validate_logger_config(config)
-        assert any("requires at least one middleware" in err for err in errors)
+        assert "ENTERPRISE profile requires at least one middleware (correlation)" in errors
 
-    def test_throttling_without_maxrate(self):
+    def test_throttling_without_maxrate(self, base_config):
         """Test throttling requires maxRate."""
-        config = LoggerConfig(
-            profile=LoggingProfile.STRUCTURED,
-            service="test-service",
-            sinks=[SinkConfig(type="console")],
-            throttling=ThrottlingConfig(enabled=True),
-        )
+        config = replace(base_config, throttling=ThrottlingConfig(enabled=True))
         errors = validate_logger_config(config)
-        assert any("requires maxRate" in err for err in errors)
+        assert "Throttling requires maxRate to be set" in errors
 
-    def test_throttling_invalid_burst_size(self):
+    def test_throttling_invalid_burst_size(self, base_config):
         """Test throttling with invalid burst size."""
-        config = LoggerConfig(
-            profile=LoggingProfile.STRUCTURED,
-            service="test-service",
-            sinks=[SinkConfig(type="console")],
+        config = replace(
+            base_config,
             throttling=ThrottlingConfig(enabled=True, maxRate=1000, burstSize=0),
         )
         errors = validate_logger_config(config)
-        assert any("Burst size must be at least 1" in err for err in errors)
+        assert "Burst size must be at least 1" in errors
+
+    def test_non_copyable_option_values(self, base_config):
+        """Test validation does not deep-copy sink options or middleware config."""
+        config = replace(
+            base_config,
+            sinks=[SinkConfig(type="console", format="json", options={"lock": threading.Lock()})],
+            middleware=[MiddlewareConfig(name="correlation", config={"lock": threading.Lock()})],
+        )
+        errors = validate_logger_config(config)
+        assert errors == []
 
 
 class TestConfigFactories: